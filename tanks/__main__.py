@@ -22,7 +22,6 @@ Title screen controls:
 import os
 import sys
 import threading
-from queue import Queue, Empty
 from pathlib import Path
 
 # Set dummy video driver BEFORE importing pygame when headless
@@ -33,28 +32,50 @@ import pygame
 
 from tanks.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, FPS, LEVELS_DIR,
-    CELL_SIZE, PLAYER_TANK_COLORS, FACING_TO_ANGLE,
+    PLAYER_TANK_COLORS,
     GamePhase, GameMode, API_HOST, API_PORT, TankCommand,
+    StrategyCmd, ClearStrategyCmd,
 )
 from tanks.assets import AssetManager
 from tanks.level import load_level
 from tanks.renderer import LevelRenderer
-from tanks.tank import Tank, check_bullet_tank_collisions
+from tanks.bullets import BULLETS
+from tanks.tank import Tank, check_bullet_tank_collisions, set_tick
 from tanks.game_state import GameState
-from tanks.game_history import GameHistory
+from tanks.game_history import GameHistory, SNAPSHOT_INTERVAL
+from tanks.ring_queue import RingQueue
 from tanks.tank_api import run_tank_api
 from tanks.ai_controller import AIController
 from tanks.demo_controller import DemoController, DEMO_SCENARIOS
-from tanks.navigation import is_in_sight, angle_to_target, angle_error
+from tanks.navigation import aim_and_fire
 from tanks.obstacle_avoidance import ObstacleAvoider
 from tanks.command_system import CommandExecutor
 
-
-def _load_level_json(level_path: Path) -> dict:
-    """Load a level file as raw JSON dict for serving to browser clients."""
-    import json
-    with open(level_path) as f:
-        return json.load(f)
+# Keys that drive the manual-mode tank, in command-logging priority
+# order (matches the old if/elif ladder). The hot loop keeps a set of
+# currently-held keys updated from KEYDOWN/KEYUP events instead of
+# materializing pygame.key.get_pressed()'s full scancode sequence
+# every frame.
+_KEY_TO_CMD = {
+    pygame.K_w: "forward",
+    pygame.K_s: "backward",
+    pygame.K_a: "rotate_left",
+    pygame.K_d: "rotate_right",
+    pygame.K_SPACE: "shoot",
+}
+
+# Title-screen menu index -> game mode. Indices 0 (manual play) and
+# 2 (logs screen) are handled specially in the event loop.
+_MODE_BY_INDEX = (None, GameMode.DEMO, None)
+
+# Phases where ESC means "back to title" rather than "quit"
+_INGAME_PHASES = frozenset({GamePhase.PLAYING, GamePhase.GAME_OVER})
+
+# SCALED routes presentation through SDL2's accelerated renderer (the
+# frame is uploaded as a texture and flipped by the GPU) and DOUBLEBUF
+# pairs with the per-frame flip; without flags pygame uses the plain
+# software path. Falls back gracefully where no fast renderer exists.
+_DISPLAY_FLAGS = pygame.SCALED | pygame.DOUBLEBUF
 
 
 def _apply_with_avoidance(tank, cmd, level, avoider):
@@ -73,55 +94,104 @@ def _apply_with_avoidance(tank, cmd, level, avoider):
     tank.apply_command(cmd, level)
 
 
+def _tank_view(tank) -> dict:
+    """Build a minimal snapshot dict of a live Tank for executor/sight checks.
+
+    Read directly from the Tank object on the main thread — no GameState
+    lock and none of the bullet-list copying snapshot() does.
+    """
+    return {"x": tank.x, "y": tank.y, "angle": tank.angle,
+            "alive": tank.alive}
+
+
+def _auto_shoot(shooter, target, level):
+    """Turn *shooter* toward *target* and fire when it has a clear shot.
+
+    One shared body for both players' auto-shoot — the blocks were
+    mirror-image copies of the same aim_and_fire dance.
+    """
+    if not (shooter.alive and target.alive):
+        return
+    rotate_cmd, in_sight = aim_and_fire(
+        shooter.x, shooter.y, shooter.angle,
+        target.x, target.y, level=level)
+    if in_sight:
+        if rotate_cmd is not None:
+            shooter.apply_command(rotate_cmd, level)
+        shooter.apply_command(TankCommand.SHOOT, level)
+
+
+def _filter_events():
+    """Restrict the event queue to the event types the loops handle.
+
+    Blocks MOUSEMOTION and friends at the source so the per-frame
+    pygame.event.get() drain never has to iterate past them.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
+
+
 def _spawn_tanks(level):
     """Create player 1 and player 2 Tank objects from level spawn points."""
+    BULLETS.clear()  # drop any bullets left over from the previous game
     tanks = []
     for key, player_num in [("player1", 1), ("player2", 2)]:
         sp = level.spawns[key]
         # AI opponent (player2) moves at 75% speed
         speed_mult = 0.75 if player_num == 2 else 1.0
         tanks.append(Tank(
-            sp.col * CELL_SIZE + CELL_SIZE // 2,
-            sp.row * CELL_SIZE + CELL_SIZE // 2,
-            FACING_TO_ANGLE[sp.facing],
+            sp.px, sp.py, sp.angle,
             PLAYER_TANK_COLORS[player_num],
             speed_multiplier=speed_mult,
         ))
     return tanks
 
 
-def _render_controls_banner(screen, countdown_seconds):
-    """Render an info banner showing controls at the start of play mode."""
-    # Semi-transparent overlay
-    overlay = pygame.Surface((WINDOW_WIDTH, 280), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    screen.blit(overlay, (0, WINDOW_HEIGHT // 2 - 140))
+# Controls banner caches: the overlay, title and controls lines never
+# change, and the countdown footer only takes a handful of values, so
+# each surface is rasterized once instead of per frame during the
+# intro. Keyed lazily because fonts need pygame.init() first.
+_banner_static = None
+_banner_footers = {}
 
-    # Title
-    title_font = pygame.font.SysFont("consolas", 48, bold=True)
-    title_surf = title_font.render("CONTROLS", True, (255, 255, 100))
-    screen.blit(title_surf, title_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 90)))
 
-    # Controls
-    controls_font = pygame.font.SysFont("consolas", 32)
-    y_offset = WINDOW_HEIGHT // 2 - 30
-
-    controls = [
-        "WASD - Move  •  SPACE - Shoot  •  ESC - Quit",
-    ]
-
-    for control in controls:
-        surf = controls_font.render(control, True, (220, 220, 220))
-        screen.blit(surf, surf.get_rect(center=(WINDOW_WIDTH // 2, y_offset)))
-        y_offset += 45
-
-    # Footer with countdown
-    footer_font = pygame.font.SysFont("consolas", 28, bold=True)
-    footer = footer_font.render(f"AI will start moving: {countdown_seconds}", True, (150, 255, 150))
-    screen.blit(footer, footer.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 70)))
-
-
-def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, game_history=None):
+def _render_controls_banner(screen, countdown_seconds):
+    """Render an info banner showing controls at the start of play mode."""
+    global _banner_static
+    if _banner_static is None:
+        overlay = pygame.Surface((WINDOW_WIDTH, 280), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 200))
+        title_font = pygame.font.SysFont("consolas", 48, bold=True)
+        title = title_font.render("CONTROLS", True, (255, 255, 100))
+        controls_font = pygame.font.SysFont("consolas", 32)
+        controls = controls_font.render(
+            "WASD - Move  •  SPACE - Shoot  •  ESC - Quit",
+            True, (220, 220, 220),
+        )
+        _banner_static = (
+            (overlay.convert_alpha(), (0, WINDOW_HEIGHT // 2 - 140)),
+            (title.convert_alpha(), title.get_rect(
+                center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 90))),
+            (controls.convert_alpha(), controls.get_rect(
+                center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30))),
+        )
+    for surf, pos in _banner_static:
+        screen.blit(surf, pos)
+
+    footer = _banner_footers.get(countdown_seconds)
+    if footer is None:
+        footer_font = pygame.font.SysFont("consolas", 28, bold=True)
+        footer = footer_font.render(
+            f"AI will start moving: {countdown_seconds}",
+            True, (150, 255, 150),
+        ).convert_alpha()
+        _banner_footers[countdown_seconds] = footer
+    screen.blit(footer, footer.get_rect(
+        center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 70)))
+
+
+def _run_manual(level_path: Path, existing_screen=None, existing_assets=None,
+                game_history=None, existing_renderer=None):
     """Manual mode: keyboard-controlled player 1 vs AI opponent.
 
     Args:
@@ -129,17 +199,21 @@ def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, ga
         existing_screen: Existing pygame screen surface (if called from title screen)
         existing_assets: Existing AssetManager (if called from title screen)
         game_history: GameHistory object for logging (if called from title screen)
+        existing_renderer: Existing LevelRenderer whose caches (fonts,
+            text, composed background, overlays) should be reused
     """
     # If called from title screen, reuse pygame initialization
     if existing_screen is None:
         pygame.init()
-        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                         _DISPLAY_FLAGS)
         pygame.display.set_caption(WINDOW_TITLE + " [MANUAL vs AI]")
         standalone_mode = True
     else:
         screen = existing_screen
         pygame.display.set_caption(WINDOW_TITLE + " [MANUAL vs AI]")
         standalone_mode = False
+    _filter_events()
 
     clock = pygame.time.Clock()
 
@@ -150,24 +224,27 @@ def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, ga
         asset_mgr = existing_assets
 
     current_level = load_level(level_path)
-    renderer = LevelRenderer(screen, asset_mgr)
+    renderer = existing_renderer or LevelRenderer(screen, asset_mgr)
     game_state = GameState()
     tanks = _spawn_tanks(current_level)
 
-    # Create game history if not provided
+    # Create game history if not provided; either way it must start
+    # empty — ticks restart at 0 and stale entries would break the
+    # tick ordering get_history() relies on
     if game_history is None:
         game_history = GameHistory()
+    else:
+        game_history.reset()
 
     # Set up game state for AI
     game_state.phase = GamePhase.PLAYING
     game_state.mode = GameMode.ONE_PLAYER
     game_state.winner = None
     game_state.tick = 0
-    game_state.update_tank("player1", tanks[0])
-    game_state.update_tank("player2", tanks[1])
+    game_state.update_tanks({"player1": tanks[0], "player2": tanks[1]})
 
     # Start AI opponent
-    ai_queue = Queue()
+    ai_queue = RingQueue()
     ai_controller = AIController(ai_queue, game_state, level=current_level)
     ai_thread = threading.Thread(target=ai_controller.start, daemon=True)
     ai_thread.start()
@@ -177,12 +254,19 @@ def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, ga
     start_time = pygame.time.get_ticks()
     show_instructions = True
     last_p1_cmd = None  # Track last player 1 command for logging
+    snapshot_cooldown = SNAPSHOT_INTERVAL
+    held_keys = set()  # updated from KEYDOWN/KEYUP, read every frame
 
     while running:
+        # One clock read per frame, shared by all tank cooldown checks
+        set_tick(pygame.time.get_ticks())
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYUP:
+                held_keys.discard(event.key)
             elif event.type == pygame.KEYDOWN:
+                held_keys.add(event.key)
                 if event.key == pygame.K_ESCAPE:
                     running = False
                 elif event.key == pygame.K_RETURN and game_over:
@@ -194,24 +278,21 @@ def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, ga
                     renderer.show_collision = not renderer.show_collision
 
         if not game_over:
-            # Player 1 keyboard input
-            keys = pygame.key.get_pressed()
-            tanks[0].handle_input(keys, current_level)
+            # Player 1 keyboard input — skip handle_input entirely on
+            # idle frames (no movement/shoot key down)
+            any_input = not held_keys.isdisjoint(_KEY_TO_CMD)
+            if any_input:
+                tanks[0].handle_input(held_keys, current_level)
 
             # Log player 1 keyboard inputs as commands
             if tanks[0].alive:
                 # Detect current command from keyboard
                 current_cmd = None
-                if keys[pygame.K_w]:
-                    current_cmd = "forward"
-                elif keys[pygame.K_s]:
-                    current_cmd = "backward"
-                elif keys[pygame.K_a]:
-                    current_cmd = "rotate_left"
-                elif keys[pygame.K_d]:
-                    current_cmd = "rotate_right"
-                elif keys[pygame.K_SPACE]:
-                    current_cmd = "shoot"
+                if any_input:
+                    current_cmd = next(
+                        cmd for key, cmd in _KEY_TO_CMD.items()
+                        if key in held_keys
+                    )
 
                 # Update last command if a new one is detected
                 if current_cmd is not None:
@@ -222,17 +303,12 @@ def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, ga
                     game_history.log_command(game_state.tick, "player1", last_p1_cmd, "direct")
 
             # Process AI commands for player 2
-            while True:
-                try:
-                    cmd = ai_queue.get_nowait()
-                    game_history.log_command(game_state.tick, "player2", cmd.value, "direct")
-                    tanks[1].apply_command(cmd, current_level)
-                except Empty:
-                    break
+            for cmd in ai_queue.drain():
+                game_history.log_command(game_state.tick, "player2", cmd.value, "direct")
+                tanks[1].apply_command(cmd, current_level)
 
-            # Update bullets
-            for t in tanks:
-                t.update_bullets(current_level)
+            # Update bullets — one vectorized step over the shared pool
+            BULLETS.step(current_level)
 
             # Check collisions
             check_bullet_tank_collisions(tanks)
@@ -247,12 +323,14 @@ def _run_manual(level_path: Path, existing_screen=None, existing_assets=None, ga
 
             # Update game state for AI
             game_state.tick += 1
-            game_state.update_tank("player1", tanks[0])
-            game_state.update_tank("player2", tanks[1])
+            game_state.update_tanks({"player1": tanks[0], "player2": tanks[1]})
 
-            # Log periodic snapshots every 100 ticks (~3.3 seconds at 30 FPS)
-            if game_history.should_snapshot(game_state.tick):
+            # Log periodic snapshots on a countdown — cheaper per frame
+            # than a should_snapshot() call doing lookup + compare
+            snapshot_cooldown -= 1
+            if not snapshot_cooldown:
                 game_history.log_snapshot(game_state.tick, game_state.snapshot())
+                snapshot_cooldown = SNAPSHOT_INTERVAL
 
         # Check if instructions should still be shown
         elapsed_ms = pygame.time.get_ticks() - start_time
@@ -286,10 +364,12 @@ def _run_game(level_path: Path, headless: bool = False):
         headless: If True, run without display (server-only mode for browser play).
     """
     pygame.init()
+    _filter_events()
     if headless:
         screen = pygame.display.set_mode((1, 1))
     else:
-        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                         _DISPLAY_FLAGS)
         pygame.display.set_caption(WINDOW_TITLE)
     clock = pygame.time.Clock()
 
@@ -308,15 +388,18 @@ def _run_game(level_path: Path, headless: bool = False):
     demo_controller = None
     p1_avoider = ObstacleAvoider()
     p2_avoider = ObstacleAvoider()
-    p1_auto_shoot = False
-    p2_auto_shoot = False
-    p1_executor = None
-    p2_executor = None
-
-    # Queues
-    p1_queue = Queue()
-    p2_queue = Queue()
-    ai_queue = Queue()
+    auto_shoot = {"player1": False, "player2": False}
+    # One executor per player for the whole session — strategy changes
+    # reuse them via set_commands()/clear() instead of reallocating
+    p1_executor = CommandExecutor(level=current_level)
+    p2_executor = CommandExecutor(level=current_level)
+    snapshot_cooldown = SNAPSHOT_INTERVAL
+
+    # Queues — RingQueue allows the main loop to drain each one with a
+    # single lock acquisition per frame instead of exception-driven polling
+    p1_queue = RingQueue()
+    p2_queue = RingQueue()
+    ai_queue = RingQueue()
 
     # Start API server immediately (queues will be None until game mode starts)
     api_thread = threading.Thread(
@@ -330,21 +413,19 @@ def _run_game(level_path: Path, headless: bool = False):
         nonlocal phase, tanks, ai_controller, demo_controller
         nonlocal p1_queue, p2_queue, ai_queue
         nonlocal p1_avoider, p2_avoider
-        nonlocal p1_auto_shoot, p2_auto_shoot
-        nonlocal p1_executor, p2_executor
 
         # Fresh queues
-        p1_queue = Queue()
-        p2_queue = Queue()
-        ai_queue = Queue()
+        p1_queue = RingQueue()
+        p2_queue = RingQueue()
+        ai_queue = RingQueue()
 
         # Fresh avoiders for the new round
         p1_avoider = ObstacleAvoider()
         p2_avoider = ObstacleAvoider()
-        p1_auto_shoot = False
-        p2_auto_shoot = False
-        p1_executor = None
-        p2_executor = None
+        auto_shoot["player1"] = False
+        auto_shoot["player2"] = False
+        p1_executor.clear()
+        p2_executor.clear()
         game_state.set_strategy("player1", None)
         game_state.set_strategy("player2", None)
 
@@ -354,10 +435,12 @@ def _run_game(level_path: Path, headless: bool = False):
         game_state.mode = mode
         game_state.winner = None
         game_state.tick = 0
+        # Ticks restart at 0: clear the history so its buffers stay
+        # tick-ordered for get_history()'s bisect filtering
+        game_history.reset()
 
         # Seed initial tank state so demo/AI can read positions immediately
-        game_state.update_tank("player1", tanks[0])
-        game_state.update_tank("player2", tanks[1])
+        game_state.update_tanks({"player1": tanks[0], "player2": tanks[1]})
 
         # Update API server queues (skip for demo mode)
         if mode != GameMode.DEMO:
@@ -402,8 +485,41 @@ def _run_game(level_path: Path, headless: bool = False):
         api_module._p1_queue = None
         api_module._p2_queue = None
 
+    def process_item(item, player, tank, executor, avoider, use_avoidance):
+        """Dispatch one drained queue item for either player.
+
+        One shared body for both drain loops — the p1 and p2 ladders
+        were mirror-image copies of the same type/command dispatch.
+        """
+        if type(item) is StrategyCmd:
+            executor.set_commands(item.parsed)
+            game_state.set_strategy(player, item.text)
+            game_history.log_command(game_state.tick, player,
+                                     item.text, "strategy")
+        elif type(item) is ClearStrategyCmd:
+            executor.clear()
+            game_state.set_strategy(player, None)
+            game_history.log_command(game_state.tick, player,
+                                     "stop", "strategy")
+        elif item == TankCommand.AUTO_SHOOT_ON:
+            auto_shoot[player] = True
+            game_history.log_command(game_state.tick, player,
+                                     item.value, "direct")
+        elif item == TankCommand.AUTO_SHOOT_OFF:
+            auto_shoot[player] = False
+            game_history.log_command(game_state.tick, player,
+                                     item.value, "direct")
+        elif use_avoidance:
+            game_history.log_command(game_state.tick, player,
+                                     item.value, "direct")
+            _apply_with_avoidance(tank, item, current_level, avoider)
+        else:
+            game_history.log_command(game_state.tick, player,
+                                     item.value, "direct")
+            tank.apply_command(item, current_level)
+
     # Control queue for thread-safe game lifecycle commands from the API
-    control_queue = Queue()
+    control_queue = RingQueue()
 
     def api_start_game(mode: GameMode):
         """Thread-safe wrapper: enqueue a start request for the main loop."""
@@ -417,118 +533,135 @@ def _run_game(level_path: Path, headless: bool = False):
     import tanks.tank_api as api_module
     api_module._start_game_fn = api_start_game
     api_module._return_to_title_fn = api_return_to_title
-    api_module._level_data = _load_level_json(level_path)
+    api_module._level_data = current_level.raw_json
+
+    # ---- Keyboard handlers, dispatched via a per-phase key table ----
+
+    def on_escape():
+        nonlocal phase, running
+        if phase in _INGAME_PHASES:
+            return_to_title()
+        elif phase == GamePhase.LOGS:
+            phase = GamePhase.TITLE_SCREEN
+            game_state.phase = GamePhase.TITLE_SCREEN
+        elif phase == GamePhase.TITLE_SCREEN:
+            running = False
+
+    def on_title_up():
+        nonlocal selected_index
+        selected_index = (selected_index - 1) % 3
+
+    def on_title_down():
+        nonlocal selected_index
+        selected_index = (selected_index + 1) % 3
+
+    def on_title_enter():
+        nonlocal phase
+        if selected_index == 0:
+            _run_manual(level_path, screen, asset_mgr, game_history,
+                        existing_renderer=renderer)
+            pygame.display.set_caption(WINDOW_TITLE)
+        elif selected_index == 2:
+            phase = GamePhase.LOGS
+        else:
+            start_game(_MODE_BY_INDEX[selected_index])
+
+    def on_game_over_enter():
+        nonlocal phase
+        phase = GamePhase.TITLE_SCREEN
+        game_state.phase = GamePhase.TITLE_SCREEN
+
+    def on_toggle_grid():
+        renderer.show_grid = not renderer.show_grid
+
+    def on_toggle_collision():
+        renderer.show_collision = not renderer.show_collision
+
+    key_handlers = {
+        GamePhase.TITLE_SCREEN: {
+            pygame.K_UP: on_title_up,
+            pygame.K_DOWN: on_title_down,
+            pygame.K_RETURN: on_title_enter,
+        },
+        GamePhase.GAME_OVER: {
+            pygame.K_RETURN: on_game_over_enter,
+        },
+        GamePhase.PLAYING: {
+            pygame.K_g: on_toggle_grid,
+            pygame.K_c: on_toggle_collision,
+        },
+        GamePhase.LOGS: {},
+    }
 
     if headless:
         print(f"\n[HEADLESS] Server running. Open http://localhost:{API_PORT}/play in your browser.")
         print("[HEADLESS] Waiting for game start via browser or POST /start ...\n")
 
     running = True
+    # Marker of what the static screens (title/game-over/logs) last
+    # drew. While it matches, their frames are identical, so the render
+    # and the full-screen vsynced flip are skipped; any event or a
+    # phase change clears it. The playing phase always renders.
+    last_ui = None
     while running:
+        # One clock read per frame, shared by all tank cooldown checks
+        set_tick(pygame.time.get_ticks())
+        rendered = False
+
         # ---- Process control queue (thread-safe game lifecycle from API) ----
-        while True:
-            try:
-                ctrl = control_queue.get_nowait()
-                if ctrl[0] == "start":
-                    start_game(ctrl[1])
-                elif ctrl[0] == "return_to_title":
-                    return_to_title()
-            except Empty:
-                break
+        for ctrl in control_queue.drain():
+            if ctrl[0] == "start":
+                start_game(ctrl[1])
+            elif ctrl[0] == "return_to_title":
+                return_to_title()
 
         # ---- Event handling (GUI mode only) ----
         if headless:
             pygame.event.pump()  # Prevent pygame from freezing
         else:
             for event in pygame.event.get():
+                last_ui = None  # input may change what is on screen
                 if event.type == pygame.QUIT:
                     running = False
 
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        if phase == GamePhase.PLAYING or phase == GamePhase.GAME_OVER:
-                            return_to_title()
-                            phase = GamePhase.TITLE_SCREEN
-                        elif phase == GamePhase.LOGS:
-                            phase = GamePhase.TITLE_SCREEN
-                            game_state.phase = GamePhase.TITLE_SCREEN
-                        elif phase == GamePhase.TITLE_SCREEN:
-                            running = False
-
-                    elif phase == GamePhase.TITLE_SCREEN:
-                        if event.key == pygame.K_UP:
-                            selected_index = (selected_index - 1) % 3
-                        elif event.key == pygame.K_DOWN:
-                            selected_index = (selected_index + 1) % 3
-                        elif event.key == pygame.K_RETURN:
-                            if selected_index == 0:
-                                _run_manual(level_path, screen, asset_mgr, game_history)
-                                pygame.display.set_caption(WINDOW_TITLE)
-                            elif selected_index == 2:
-                                phase = GamePhase.LOGS
-                            else:
-                                mode_map = {
-                                    1: GameMode.DEMO,
-                                }
-                                start_game(mode_map[selected_index])
-
-                    elif phase == GamePhase.GAME_OVER:
-                        if event.key == pygame.K_RETURN:
-                            phase = GamePhase.TITLE_SCREEN
-                            game_state.phase = GamePhase.TITLE_SCREEN
-
-                    elif phase == GamePhase.PLAYING:
-                        if event.key == pygame.K_g:
-                            renderer.show_grid = not renderer.show_grid
-                        elif event.key == pygame.K_c:
-                            renderer.show_collision = not renderer.show_collision
+                        on_escape()
+                    else:
+                        handler = key_handlers[phase].get(event.key)
+                        if handler:
+                            handler()
 
         # ---- Title Screen ----
         if phase == GamePhase.TITLE_SCREEN:
             if not headless:
-                renderer.render_title_screen(selected_index)
+                ui = (GamePhase.TITLE_SCREEN, selected_index)
+                if ui != last_ui:
+                    renderer.render_title_screen(selected_index)
+                    last_ui = ui
+                    rendered = True
 
         # ---- Playing ----
         elif phase == GamePhase.PLAYING and tanks:
             # Demo: check for scenario reset request
-            if demo_controller and demo_controller._request_reset:
+            if demo_controller and demo_controller._reset_request.is_set():
                 tanks = _spawn_tanks(current_level)
                 game_state.winner = None
                 game_state.tick = 0
+                # Ticks restart with the scenario: clear the history so
+                # its buffers stay tick-ordered (same as start_game)
+                game_history.reset()
                 game_state.phase = GamePhase.PLAYING
-                game_state.update_tank("player1", tanks[0])
-                game_state.update_tank("player2", tanks[1])
-                demo_controller._request_reset = False
-
-            # Drain player 1 command queue (API — avoidance enabled)
-            while True:
-                try:
-                    item = p1_queue.get_nowait()
-                    # print(f"[MAIN LOOP] Received from p1_queue: {item}")
-                    if isinstance(item, tuple) and item[0] == "strategy":
-                        _, text, parsed_cmds = item
-                        p1_executor = CommandExecutor(level=current_level)
-                        p1_executor.set_commands(parsed_cmds)
-                        game_state.set_strategy("player1", text)
-                        game_history.log_command(game_state.tick, "player1", text, "strategy")
-                    elif isinstance(item, tuple) and item[0] == "clear_strategy":
-                        p1_executor = None
-                        game_state.set_strategy("player1", None)
-                        game_history.log_command(game_state.tick, "player1", "stop", "strategy")
-                    elif item == TankCommand.AUTO_SHOOT_ON:
-                        p1_auto_shoot = True
-                        game_history.log_command(game_state.tick, "player1", item.value, "direct")
-                    elif item == TankCommand.AUTO_SHOOT_OFF:
-                        p1_auto_shoot = False
-                        game_history.log_command(game_state.tick, "player1", item.value, "direct")
-                    else:
-                        game_history.log_command(game_state.tick, "player1", item.value, "direct")
-                        _apply_with_avoidance(tanks[0], item, current_level,
-                                              p1_avoider)
-                except Empty:
-                    break
+                game_state.update_tanks({"player1": tanks[0], "player2": tanks[1]})
+                demo_controller._reset_request.clear()
+                demo_controller._reset_done.set()
+
+            # Player 1 queue (API — avoidance enabled)
+            for item in p1_queue.drain():
+                process_item(item, "player1", tanks[0], p1_executor,
+                             p1_avoider, True)
 
-            # Drain player 2 / AI / demo command queue
+            # Player 2 / AI / demo command queue
             if game_state.mode == GameMode.DEMO:
                 # Demo uses CommandExecutor which already has avoidance
                 q, use_avoidance = p2_queue, False
@@ -538,82 +671,34 @@ def _run_game(level_path: Path, headless: bool = False):
             else:
                 # AI controller already applies avoidance internally
                 q, use_avoidance = ai_queue, False
-            while True:
-                try:
-                    item = q.get_nowait()
-                    if isinstance(item, tuple) and item[0] == "strategy":
-                        _, text, parsed_cmds = item
-                        p2_executor = CommandExecutor(level=current_level)
-                        p2_executor.set_commands(parsed_cmds)
-                        game_state.set_strategy("player2", text)
-                        game_history.log_command(game_state.tick, "player2", text, "strategy")
-                    elif isinstance(item, tuple) and item[0] == "clear_strategy":
-                        p2_executor = None
-                        game_state.set_strategy("player2", None)
-                        game_history.log_command(game_state.tick, "player2", "stop", "strategy")
-                    elif item == TankCommand.AUTO_SHOOT_ON:
-                        p2_auto_shoot = True
-                        game_history.log_command(game_state.tick, "player2", item.value, "direct")
-                    elif item == TankCommand.AUTO_SHOOT_OFF:
-                        p2_auto_shoot = False
-                        game_history.log_command(game_state.tick, "player2", item.value, "direct")
-                    elif use_avoidance:
-                        game_history.log_command(game_state.tick, "player2", item.value, "direct")
-                        _apply_with_avoidance(tanks[1], item, current_level,
-                                              p2_avoider)
-                    else:
-                        game_history.log_command(game_state.tick, "player2", item.value, "direct")
-                        tanks[1].apply_command(item, current_level)
-                except Empty:
-                    break
-
-            # Tick NL executors (single snapshot for both)
-            if p1_executor is not None or p2_executor is not None:
-                snap = game_state.snapshot()["tanks"]
-                s1 = snap.get("player1", {})
-                s2 = snap.get("player2", {})
-                if p1_executor is not None and tanks[0].alive:
-                    for cmd in p1_executor.tick(s1, s2):
-                        _apply_with_avoidance(tanks[0], cmd, current_level,
-                                              p1_avoider)
-                if p2_executor is not None and tanks[1].alive:
-                    for cmd in p2_executor.tick(s2, s1):
-                        _apply_with_avoidance(tanks[1], cmd, current_level,
-                                              p2_avoider)
+            for item in q.drain():
+                process_item(item, "player2", tanks[1], p2_executor,
+                             p2_avoider, use_avoidance)
+
+            # Single per-frame view of both tanks, shared by the NL
+            # executors and the auto-shoot checks below
+            p1_view = _tank_view(tanks[0])
+            p2_view = _tank_view(tanks[1])
+
+            # Tick NL executors
+            if p1_executor.active and tanks[0].alive:
+                for cmd in p1_executor.tick(p1_view, p2_view):
+                    _apply_with_avoidance(tanks[0], cmd, current_level,
+                                          p1_avoider)
+            if p2_executor.active and tanks[1].alive:
+                for cmd in p2_executor.tick(p2_view, p1_view):
+                    _apply_with_avoidance(tanks[1], cmd, current_level,
+                                          p2_avoider)
 
             # Auto-shoot: if enabled, track the enemy and fire when in FOV
             # with clear line of sight through obstacles
-            if p1_auto_shoot and tanks[0].alive and tanks[1].alive:
-                me_snap = {"x": tanks[0].x, "y": tanks[0].y,
-                           "angle": tanks[0].angle}
-                tgt_snap = {"x": tanks[1].x, "y": tanks[1].y,
-                            "alive": tanks[1].alive}
-                if is_in_sight(me_snap, tgt_snap, level=current_level):
-                    desired = angle_to_target(tanks[0].x, tanks[0].y,
-                                              tanks[1].x, tanks[1].y)
-                    err = angle_error(desired, tanks[0].angle)
-                    if abs(err) > 3:
-                        cmd = TankCommand.ROTATE_RIGHT if err > 0 else TankCommand.ROTATE_LEFT
-                        tanks[0].apply_command(cmd, current_level)
-                    tanks[0].apply_command(TankCommand.SHOOT, current_level)
-
-            if p2_auto_shoot and tanks[1].alive and tanks[0].alive:
-                me_snap = {"x": tanks[1].x, "y": tanks[1].y,
-                           "angle": tanks[1].angle}
-                tgt_snap = {"x": tanks[0].x, "y": tanks[0].y,
-                            "alive": tanks[0].alive}
-                if is_in_sight(me_snap, tgt_snap, level=current_level):
-                    desired = angle_to_target(tanks[1].x, tanks[1].y,
-                                              tanks[0].x, tanks[0].y)
-                    err = angle_error(desired, tanks[1].angle)
-                    if abs(err) > 3:
-                        cmd = TankCommand.ROTATE_RIGHT if err > 0 else TankCommand.ROTATE_LEFT
-                        tanks[1].apply_command(cmd, current_level)
-                    tanks[1].apply_command(TankCommand.SHOOT, current_level)
-
-            # Update bullets
-            for t in tanks:
-                t.update_bullets(current_level)
+            if auto_shoot["player1"]:
+                _auto_shoot(tanks[0], tanks[1], current_level)
+            if auto_shoot["player2"]:
+                _auto_shoot(tanks[1], tanks[0], current_level)
+
+            # Update bullets — one vectorized step over the shared pool
+            BULLETS.step(current_level)
 
             # Bullet-tank collisions
             check_bullet_tank_collisions(tanks)
@@ -624,7 +709,7 @@ def _run_game(level_path: Path, headless: bool = False):
                     if game_state.mode == GameMode.DEMO:
                         # In demo, auto-reset for next scenario
                         if demo_controller:
-                            demo_controller._request_reset = True
+                            demo_controller._reset_request.set()
                         break
                     winners = [other for other in tanks if other.alive]
                     game_state.winner = winners[0].color if winners else None
@@ -637,8 +722,7 @@ def _run_game(level_path: Path, headless: bool = False):
 
             # Update shared state for API/AI/demo reads
             game_state.tick += 1
-            game_state.update_tank("player1", tanks[0])
-            game_state.update_tank("player2", tanks[1])
+            game_state.update_tanks({"player1": tanks[0], "player2": tanks[1]})
 
             # Update demo scenario info for browser overlay
             if demo_controller and game_state.mode == GameMode.DEMO:
@@ -653,9 +737,12 @@ def _run_game(level_path: Path, headless: bool = False):
             else:
                 game_state.demo = None
 
-            # Log periodic snapshots every 100 ticks (~3.3 seconds at 30 FPS)
-            if game_history.should_snapshot(game_state.tick):
+            # Log periodic snapshots on a countdown — cheaper per frame
+            # than a should_snapshot() call doing lookup + compare
+            snapshot_cooldown -= 1
+            if not snapshot_cooldown:
                 game_history.log_snapshot(game_state.tick, game_state.snapshot())
+                snapshot_cooldown = SNAPSHOT_INTERVAL
 
             # Render (GUI mode only)
             if not headless:
@@ -668,19 +755,29 @@ def _run_game(level_path: Path, headless: bool = False):
                         demo_controller.current_scenario_index,
                         len(DEMO_SCENARIOS),
                     )
+                last_ui = None
+                rendered = True
 
         # ---- Game Over ----
         elif phase == GamePhase.GAME_OVER:
             if not headless:
-                renderer.render(current_level, tanks)
-                renderer.render_game_over(game_state.winner or "???")
+                ui = (GamePhase.GAME_OVER, game_state.winner)
+                if ui != last_ui:
+                    renderer.render(current_level, tanks)
+                    renderer.render_game_over(game_state.winner or "???")
+                    last_ui = ui
+                    rendered = True
 
         # ---- Logs Screen ----
         elif phase == GamePhase.LOGS:
             if not headless:
-                renderer.render_logs_screen(game_history)
+                ui = (GamePhase.LOGS,)
+                if ui != last_ui:
+                    renderer.render_logs_screen(game_history)
+                    last_ui = ui
+                    rendered = True
 
-        if not headless:
+        if rendered:
             pygame.display.flip()
         clock.tick(FPS)
 
@@ -9,6 +9,7 @@ player 1, using commands like patrol, guard, and shoot on sight.
 import math
 import random
 import time
+from functools import lru_cache
 from queue import Queue
 from typing import List, Tuple
 
@@ -16,6 +17,13 @@ from tanks.constants import WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE, TankCommand
 from tanks.command_system import CommandExecutor, parse_command, CommandType
 from tanks.navigation import distance, angle_to_target, angle_error, is_in_sight
 
+# Every cell name on the 18x12 board, built once — cell lookups index
+# this instead of re-formatting "letter + number" strings
+_CELL_NAMES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(f"{chr(ord('A') + col)}{row + 1}" for row in range(12))
+    for col in range(18)
+)
+
 
 def _pixel_to_cell(x: float, y: float) -> str:
     """Convert pixel coordinates to cell notation (e.g., 'E5')."""
@@ -24,25 +32,61 @@ def _pixel_to_cell(x: float, y: float) -> str:
     # Clamp to valid range: A-R (0-17), 1-12 (0-11)
     col = max(0, min(17, col))
     row = max(0, min(11, row))
-    return f"{chr(ord('A') + col)}{row + 1}"
+    return _CELL_NAMES[col][row]
+
 
+@lru_cache(maxsize=None)
+def _cells_near(center_cell: str, radius_cells: int) -> Tuple[str, ...]:
+    """Cells within *radius_cells* of *center_cell*, excluding it.
 
-def _get_cells_near_position(x: float, y: float, radius_cells: int = 2) -> List[str]:
-    """Get a list of cells near a position within a radius."""
-    center_cell = _pixel_to_cell(x, y)
-    col_char = center_cell[0]
-    row_num = int(center_cell[1:])
+    Memoized: there are only 216 cells and a handful of radii in use,
+    so each (cell, radius) neighborhood is computed once per process
+    instead of on every strategy roll.
+    """
+    col = ord(center_cell[0]) - ord('A')
+    row = int(center_cell[1:]) - 1
 
     cells = []
     for dc in range(-radius_cells, radius_cells + 1):
         for dr in range(-radius_cells, radius_cells + 1):
             if dc == 0 and dr == 0:
                 continue
-            new_col = ord(col_char) + dc
-            new_row = row_num + dr
-            if ord('A') <= new_col <= ord('R') and 1 <= new_row <= 12:
-                cells.append(f"{chr(new_col)}{new_row}")
-    return cells
+            new_col = col + dc
+            new_row = row + dr
+            if 0 <= new_col < 18 and 0 <= new_row < 12:
+                cells.append(_CELL_NAMES[new_col][new_row])
+    return tuple(cells)
+
+
+def _get_cells_near_position(x: float, y: float, radius_cells: int = 2) -> Tuple[str, ...]:
+    """Get the cells near a position within a radius."""
+    return _cells_near(_pixel_to_cell(x, y), radius_cells)
+
+
+# Strategy phrasing templates, hoisted so a strategy roll picks one and
+# formats only it, instead of building every variant as an f-string and
+# discarding all but one
+_ASSAULT_TEMPLATES = (
+    "move to {} and shoot at anything in your sight",
+    "go to {} and fire at enemies in sight",
+    "advance to {} and shoot at targets in view",
+    "move to {} and attack anything in sight",
+)
+_GUARD_TEMPLATES = (
+    "guard {} and shoot at anything in your sight",
+    "defend position {} and fire at enemies in sight",
+    "hold {} and attack targets in view",
+)
+_INTERCEPT_TEMPLATES = (
+    "patrol between {} and {} and shoot at anything in your sight",
+    "go back and forth between {} and {} and fire at enemies in sight",
+    "circle between {} and {} and attack targets in view",
+)
+_APPROACH_TEMPLATES = (
+    "patrol between {} and {} and shoot at anything in your sight",
+    "alternate between {} and {} and fire at enemies in sight",
+    "loop between {} and {} and attack anything in view",
+)
 
 
 # No custom executor - using standard CommandExecutor like demo mode
@@ -90,31 +134,39 @@ class AIController:
         self._game_start_time = None  # Reset for next game
 
     def _run_loop(self):
+        # Absolute-deadline scheduling (same pattern as DemoController):
+        # each tick sleeps until the next 1/30 s boundary rather than a
+        # fixed interval after the work, so tick cost doesn't drift the
+        # rate. All timing uses time.monotonic — wall-clock jumps must
+        # not stretch the startup delay or strategy timers.
+        deadline = time.monotonic()
         while self._running:
             snap = self.game_state.snapshot()
 
             # Wait until actually playing
             if snap["phase"] != "playing":
                 time.sleep(0.5)
+                deadline = time.monotonic()
                 continue
 
             me = snap["tanks"].get("player2")
             enemy = snap["tanks"].get("player1")
             if me is None or enemy is None or not me["alive"]:
                 time.sleep(0.2)
+                deadline = time.monotonic()
                 continue
 
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Initialize game start time on first tick
             if self._game_start_time is None:
                 self._game_start_time = current_time
-                # print("AI: Waiting 3 seconds before engaging...")
 
             # Startup delay - give player time to get their bearings
             if current_time - self._game_start_time < self.STARTUP_DELAY:
                 # AI is idle during startup delay
                 time.sleep(self.TICK_INTERVAL)
+                deadline = time.monotonic()
                 continue
 
             # Check if we need a new strategy
@@ -134,7 +186,13 @@ class AIController:
                 for cmd in commands:
                     self.queue.put(cmd)
 
-            time.sleep(self.TICK_INTERVAL)
+            deadline += self.TICK_INTERVAL
+            slack = deadline - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                # Fell behind — rebase instead of storming to catch up
+                deadline = time.monotonic()
 
     def _generate_new_strategy(self, me: dict, enemy: dict):
         """Generate a new aggressive strategy focused on pursuing player 1."""
@@ -194,13 +252,7 @@ class AIController:
             target = enemy_cell
 
         # Randomize the phrasing
-        templates = [
-            f"move to {target} and shoot at anything in your sight",
-            f"go to {target} and fire at enemies in sight",
-            f"advance to {target} and shoot at targets in view",
-            f"move to {target} and attack anything in sight",
-        ]
-        return random.choice(templates)
+        return random.choice(_ASSAULT_TEMPLATES).format(target)
 
     def _generate_guard_near_enemy_strategy(self, enemy_cell: str) -> str:
         """Generate a guard strategy near the enemy's position."""
@@ -215,12 +267,7 @@ class AIController:
         else:
             guard_pos = enemy_cell
 
-        templates = [
-            f"guard {guard_pos} and shoot at anything in your sight",
-            f"defend position {guard_pos} and fire at enemies in sight",
-            f"hold {guard_pos} and attack targets in view",
-        ]
-        return random.choice(templates)
+        return random.choice(_GUARD_TEMPLATES).format(guard_pos)
 
     def _generate_intercept_patrol_strategy(self, my_cell: str, enemy_cell: str) -> str:
         """Generate a patrol strategy to intercept the enemy."""
@@ -238,12 +285,7 @@ class AIController:
             cell_a = enemy_cell
             cell_b = nearby_enemy[0] if nearby_enemy else my_cell
 
-        templates = [
-            f"patrol between {cell_a} and {cell_b} and shoot at anything in your sight",
-            f"go back and forth between {cell_a} and {cell_b} and fire at enemies in sight",
-            f"circle between {cell_a} and {cell_b} and attack targets in view",
-        ]
-        return random.choice(templates)
+        return random.choice(_INTERCEPT_TEMPLATES).format(cell_a, cell_b)
 
     def _generate_approach_patrol_strategy(self, my_cell: str, enemy_cell: str) -> str:
         """Generate a patrol strategy that approaches the enemy."""
@@ -266,9 +308,4 @@ class AIController:
             cell_a = my_cell
             cell_b = enemy_cell
 
-        templates = [
-            f"patrol between {cell_a} and {cell_b} and shoot at anything in your sight",
-            f"alternate between {cell_a} and {cell_b} and fire at enemies in sight",
-            f"loop between {cell_a} and {cell_b} and attack anything in view",
-        ]
-        return random.choice(templates)
+        return random.choice(_APPROACH_TEMPLATES).format(cell_a, cell_b)
@@ -1,4 +1,4 @@
-import random
+import numpy as np
 import pygame
 from typing import Dict, Tuple
 
@@ -13,7 +13,15 @@ class AssetManager:
     def __init__(self) -> None:
         self._terrain_cache: Dict[TerrainType, pygame.Surface] = {}
         self._obstacle_cache: Dict[Tuple[ObstacleType, int, int], pygame.Surface] = {}
+        # ObstacleType -> (path string, default span cols, default span rows);
+        # lets get_obstacle resolve a cache miss with one dict lookup
+        self._obstacle_meta: Dict[ObstacleType, Tuple[str, int, int]] = {}
         self._tank_cache: Dict[str, pygame.Surface] = {}
+        # (sprite id, integer degrees) -> rotated surface. Tank angles
+        # step in whole degrees (TANK_ROTATION_SPEED multiples) and
+        # bullets keep their spawn angle, so each unique orientation is
+        # resampled at most once instead of per frame
+        self._rot_cache: Dict[Tuple[int, int], pygame.Surface] = {}
 
     def load_all(self) -> None:
         self._load_terrain()
@@ -26,7 +34,7 @@ class AssetManager:
         for terrain_type, filename in TERRAIN_FILES.items():
             path = ENVIRONMENT_DIR / filename
             surface = pygame.image.load(str(path)).convert()
-            scaled = pygame.transform.smoothscale(surface, (CELL_SIZE, CELL_SIZE))
+            scaled = _scale(surface, (CELL_SIZE, CELL_SIZE))
             self._terrain_cache[terrain_type] = scaled
 
     def _load_obstacles(self) -> None:
@@ -35,16 +43,20 @@ class AssetManager:
             surface = pygame.image.load(str(path)).convert_alpha()
             target_w = def_w * CELL_SIZE
             target_h = def_h * CELL_SIZE
-            scaled = pygame.transform.smoothscale(surface, (target_w, target_h))
+            scaled = _scale(surface, (target_w, target_h))
             self._obstacle_cache[(obs_type, def_w, def_h)] = scaled
+            self._obstacle_meta[obs_type] = (str(path), def_w, def_h)
 
     def _load_tanks(self) -> None:
+        # Tank and bullet sprites are stored premultiplied: the renderer
+        # blits them with BLEND_PREMULTIPLIED, which skips the per-pixel
+        # alpha multiply on every rotated blit each frame.
         for player_num, color in PLAYER_TANK_COLORS.items():
             # Tank body
             body_path = TANKS_DIR / f"tank{color}.png"
             body_surf = pygame.image.load(str(body_path)).convert_alpha()
             body_scaled = _scale_to_fit(body_surf, CELL_SIZE, CELL_SIZE)
-            self._tank_cache[f"{color}_body"] = body_scaled
+            self._tank_cache[f"{color}_body"] = body_scaled.premul_alpha()
 
             # Gun barrel
             barrel_path = TANKS_DIR / f"barrel{color}.png"
@@ -52,24 +64,44 @@ class AssetManager:
             barrel_h = int(CELL_SIZE * 0.6)
             ratio = barrel_h / barrel_surf.get_height()
             barrel_w = max(1, int(barrel_surf.get_width() * ratio))
-            barrel_scaled = pygame.transform.smoothscale(barrel_surf, (barrel_w, barrel_h))
-            self._tank_cache[f"{color}_barrel"] = barrel_scaled
+            barrel_scaled = _scale(barrel_surf, (barrel_w, barrel_h))
+            self._tank_cache[f"{color}_barrel"] = barrel_scaled.premul_alpha()
+
+    def get_rotated(self, surf: pygame.Surface,
+                    angle_deg: float) -> pygame.Surface:
+        """Return *surf* rotated by *angle_deg* (CCW), memoized.
+
+        pygame.transform.rotate resamples every pixel and allocates a
+        fresh surface; with the game's quantized angles the same few
+        hundred rotations recur every frame, so cache them.
+        """
+        key = (id(surf), int(angle_deg) % 360)
+        rotated = self._rot_cache.get(key)
+        if rotated is None:
+            if len(self._rot_cache) > 2048:
+                self._rot_cache.clear()
+            rotated = pygame.transform.rotate(surf, key[1])
+            # Cache in the display's pixel format so the per-frame blit
+            # never hits SDL's format converter
+            if pygame.display.get_surface() is not None:
+                rotated = rotated.convert_alpha()
+            self._rot_cache[key] = rotated
+        return rotated
 
     def get_terrain(self, terrain_type: TerrainType) -> pygame.Surface:
         return self._terrain_cache[terrain_type]
 
     def get_obstacle(self, obs_type: ObstacleType,
                      span_w: int = None, span_h: int = None) -> pygame.Surface:
-        if span_w is None or span_h is None:
-            _, _, dw, dh = OBSTACLE_DEFS[obs_type]
-            span_w = span_w or dw
-            span_h = span_h or dh
+        path_str, dw, dh = self._obstacle_meta[obs_type]
+        if span_w is None:
+            span_w = dw
+        if span_h is None:
+            span_h = dh
         key = (obs_type, span_w, span_h)
         if key not in self._obstacle_cache:
-            directory, filename = OBSTACLE_DEFS[obs_type][0], OBSTACLE_DEFS[obs_type][1]
-            path = directory / filename
-            surface = pygame.image.load(str(path)).convert_alpha()
-            scaled = pygame.transform.smoothscale(
+            surface = pygame.image.load(path_str).convert_alpha()
+            scaled = _scale(
                 surface, (span_w * CELL_SIZE, span_h * CELL_SIZE)
             )
             self._obstacle_cache[key] = scaled
@@ -79,41 +111,71 @@ class AssetManager:
         for player_num, color in PLAYER_TANK_COLORS.items():
             path = BULLETS_DIR / f"bullet{color}.png"
             surf = pygame.image.load(str(path)).convert_alpha()
-            scaled = pygame.transform.smoothscale(surf, (16, 32))
-            self._tank_cache[f"{color}_bullet"] = scaled
+            scaled = _scale(surf, (16, 32))
+            self._tank_cache[f"{color}_bullet"] = scaled.premul_alpha()
 
     def _generate_dirt_transitions(self) -> None:
-        """Generate 4 directional dirt-on-sand transition overlays."""
+        """Generate 4 directional dirt-on-sand transition overlays.
+
+        The splotch field is rasterized entirely in NumPy: all circle
+        centers/radii/colors are drawn as arrays, then composited in
+        painter's order against a coordinate grid and blitted into the
+        surface pixels in one pass — no per-circle pygame.draw calls.
+        """
         dirt_tile = self._terrain_cache[TerrainType.DIRT]
-        dirt_color = dirt_tile.get_at((CELL_SIZE // 2, CELL_SIZE // 2))[:3]
+        dirt_color = np.array(
+            dirt_tile.get_at((CELL_SIZE // 2, CELL_SIZE // 2))[:3]
+        )
 
-        rng = random.Random(42)
+        rng = np.random.default_rng(42)
+        # Coordinate grid in surfarray layout: axis 0 is x, axis 1 is y
+        xx, yy = np.mgrid[0:CELL_SIZE, 0:CELL_SIZE]
 
         for direction in ("left", "right", "top", "bottom"):
+            t = rng.random(150)
+            t = t[rng.random(150) <= (1.0 - t) ** 1.4]
+            n = t.size
+
+            xs, ys = self._transition_coords(direction, t, rng)
+            radii = rng.integers(10, 19, n)
+            alphas = (230 * (1.0 - t) ** 0.8).astype(np.uint8)
+            rgb = np.clip(
+                dirt_color + rng.integers(-15, 16, (n, 3)), 0, 255
+            ).astype(np.uint8)
+
+            # Per-circle coverage masks; last circle covering a pixel wins
+            covered = (
+                (xx[None] - xs[:, None, None]) ** 2
+                + (yy[None] - ys[:, None, None]) ** 2
+                <= radii[:, None, None] ** 2
+            )
+            last = np.where(
+                covered, np.arange(n)[:, None, None], -1
+            ).max(axis=0)
+            hit = last >= 0
+
             surf = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-            for _ in range(150):
-                t = rng.random()
-                if rng.random() > (1.0 - t) ** 1.4:
-                    continue
-                x, y = self._transition_pos(direction, t, rng)
-                radius = rng.randint(10, 18)
-                alpha = int(230 * (1.0 - t) ** 0.8)
-                r = max(0, min(255, dirt_color[0] + rng.randint(-15, 15)))
-                g = max(0, min(255, dirt_color[1] + rng.randint(-15, 15)))
-                b = max(0, min(255, dirt_color[2] + rng.randint(-15, 15)))
-                pygame.draw.circle(surf, (r, g, b, alpha), (x, y), radius)
-            self._terrain_cache[f"transition_{direction}"] = surf
+            pixels = pygame.surfarray.pixels3d(surf)
+            alpha = pygame.surfarray.pixels_alpha(surf)
+            pixels[hit] = rgb[last[hit]]
+            alpha[hit] = alphas[last[hit]]
+            del pixels, alpha  # release surface locks before caching
+
+            # convert_alpha so later blits skip per-blit format conversion
+            self._terrain_cache[f"transition_{direction}"] = surf.convert_alpha()
 
     @staticmethod
-    def _transition_pos(direction: str, t: float, rng) -> tuple:
+    def _transition_coords(direction: str, t, rng) -> tuple:
+        """Vectorized splotch positions for a transition direction."""
+        across = rng.integers(0, CELL_SIZE, t.size)
         if direction == "right":
-            return int((1.0 - t) * CELL_SIZE), rng.randint(0, CELL_SIZE - 1)
+            return ((1.0 - t) * CELL_SIZE).astype(int), across
         elif direction == "left":
-            return int(t * CELL_SIZE), rng.randint(0, CELL_SIZE - 1)
+            return (t * CELL_SIZE).astype(int), across
         elif direction == "bottom":
-            return rng.randint(0, CELL_SIZE - 1), int((1.0 - t) * CELL_SIZE)
+            return across, ((1.0 - t) * CELL_SIZE).astype(int)
         else:  # top
-            return rng.randint(0, CELL_SIZE - 1), int(t * CELL_SIZE)
+            return across, (t * CELL_SIZE).astype(int)
 
     def get_dirt_transition(self, direction: str) -> pygame.Surface:
         """Get a directional dirt transition overlay ('left','right','top','bottom')."""
@@ -134,4 +196,17 @@ def _scale_to_fit(surface: pygame.Surface, max_w: int, max_h: int) -> pygame.Sur
     ratio = min(max_w / orig_w, max_h / orig_h)
     new_w = max(1, int(orig_w * ratio))
     new_h = max(1, int(orig_h * ratio))
-    return pygame.transform.smoothscale(surface, (new_w, new_h))
+    return _scale(surface, (new_w, new_h))
+
+
+def _scale(surface: pygame.Surface, size) -> pygame.Surface:
+    """Scale a sprite to *size*, skipping the filtered resampler when possible.
+
+    Sources already at (or within a pixel of) the target size take the
+    cheap nearest-neighbor path, which also keeps pixel art crisp;
+    anything that genuinely needs resampling still gets smoothscale.
+    """
+    w, h = surface.get_size()
+    if abs(w - size[0]) <= 1 and abs(h - size[1]) <= 1:
+        return pygame.transform.scale(surface, size)
+    return pygame.transform.smoothscale(surface, size)
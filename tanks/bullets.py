@@ -0,0 +1,129 @@
+"""Structure-of-arrays bullet storage shared by all tanks.
+
+Bullets used to live as per-tank lists of Bullet objects, updated one
+at a time in Python. They are now parallel NumPy arrays in a single
+world-level pool, so the per-frame step — position update, off-screen
+cull, obstacle-grid collision — runs as a handful of vectorized
+operations over every bullet at once instead of a method call per
+bullet per frame.
+"""
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from tanks.constants import (
+    CELL_SIZE, SIN_DEG, COS_DEG, WINDOW_WIDTH, WINDOW_HEIGHT, BULLET_SPEED,
+)
+
+
+class BulletPool:
+    """All live bullets in the world, stored as parallel arrays.
+
+    Owners are registered tank colors mapped to small integer ids so
+    ownership checks (bullets never hit their own tank) stay a
+    vectorized integer compare.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.dx = np.zeros(capacity, dtype=np.float32)
+        self.dy = np.zeros(capacity, dtype=np.float32)
+        self.angle = np.zeros(capacity, dtype=np.float32)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self.count = 0
+        self._colors: List[str] = []  # owner id -> tank color
+
+    def owner_id(self, color: str) -> int:
+        """Return the integer owner id for a tank color, registering it
+        on first use."""
+        try:
+            return self._colors.index(color)
+        except ValueError:
+            self._colors.append(color)
+            return len(self._colors) - 1
+
+    def clear(self) -> None:
+        """Drop all bullets (called when a new game spawns tanks)."""
+        self.count = 0
+
+    def spawn(self, x: float, y: float, angle: float, owner: int) -> None:
+        """Add a bullet travelling in *angle* direction (0=up, CW)."""
+        if self.count == self._capacity:
+            self._grow()
+        i = self.count
+        ai = int(angle) % 360
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = SIN_DEG[ai] * BULLET_SPEED
+        self.dy[i] = -COS_DEG[ai] * BULLET_SPEED
+        self.angle[i] = angle
+        self.owner[i] = owner
+        self.alive[i] = True
+        self.count = i + 1
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name in ("x", "y", "dx", "dy", "angle", "owner", "alive"):
+            arr = getattr(self, name)
+            setattr(self, name, np.resize(arr, self._capacity))
+
+    def step(self, level) -> None:
+        """Advance every bullet one frame and drop the dead ones.
+
+        One vectorized pass: in-place position add, off-screen mask,
+        then a fancy-indexed lookup into the level's collision grid.
+        Survivors are compacted to the front so the arrays stay dense.
+        """
+        n = self.count
+        if not n:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        np.add(x, self.dx[:n], out=x)
+        np.add(y, self.dy[:n], out=y)
+
+        keep = self.alive[:n] & (
+            (x >= 0) & (x <= WINDOW_WIDTH) & (y >= 0) & (y <= WINDOW_HEIGHT)
+        )
+
+        # Grid collision — indices clipped so off-screen bullets (already
+        # culled above) don't index outside the collision array
+        grid = level.collision_np
+        cols = np.clip((x // CELL_SIZE).astype(np.int32), 0, grid.shape[1] - 1)
+        rows = np.clip((y // CELL_SIZE).astype(np.int32), 0, grid.shape[0] - 1)
+        keep &= ~grid[rows, cols]
+
+        if keep.all():
+            return
+        idx = np.nonzero(keep)[0]
+        m = len(idx)
+        for name in ("x", "y", "dx", "dy", "angle", "owner", "alive"):
+            arr = getattr(self, name)
+            arr[:m] = arr[idx]
+        self.count = m
+
+    def iter_active(self) -> Iterator[Tuple[float, float, float, str]]:
+        """Yield (x, y, angle, color) for each live bullet."""
+        colors = self._colors
+        for i in range(self.count):
+            if self.alive[i]:
+                # plain floats — pygame rects reject numpy scalars
+                yield (float(self.x[i]), float(self.y[i]),
+                       float(self.angle[i]), colors[self.owner[i]])
+
+    def bullets_for(self, owner: int) -> List[Dict]:
+        """JSON-ready bullet dicts belonging to one tank, for snapshots."""
+        return [
+            {"x": round(float(self.x[i]), 1),
+             "y": round(float(self.y[i]), 1),
+             "angle": round(float(self.angle[i]), 1)}
+            for i in range(self.count)
+            if self.alive[i] and self.owner[i] == owner
+        ]
+
+
+# Single world-level pool shared by both tanks
+BULLETS = BulletPool()
@@ -40,7 +40,9 @@ _REPEATING_TYPES = {CommandType.PATROL, CommandType.GUARD, CommandType.SHOOT_ON_
 _MOVEMENT_TYPES = {CommandType.MOVE_TO, CommandType.PATROL, CommandType.GUARD}
 
 
-@dataclass
+# slots=True: instances are just (type, params) — no per-instance
+# __dict__ for the many short-lived commands each strategy change makes
+@dataclass(slots=True)
 class ParsedCommand:
     type: CommandType
     params: Dict = field(default_factory=dict)
@@ -70,80 +72,90 @@ _TO_PREP = r"(?:to|towards?|at)"
 _BETWEEN_PREP = r"(?:between|from)"
 _AND_CONJ = r"(?:and|to)"
 
-# Cell pattern (allows optional "cell" prefix)
-_CELL = r"(?:cell\s+)?([A-Ra-r]\d{1,2})"
+# Cell pattern (allows optional "cell" prefix); the capture group is
+# named per category so all patterns can share one combined alternation
+def _cell(group: str) -> str:
+    return rf"(?:cell\s+)?(?P<{group}>[A-Ra-r]\d{{1,2}})"
 
-# Ordered list: first match wins for each category.
-_PATTERNS = [
+
+# Ordered list: first match wins for each category. Each entry is
+# (group name, raw pattern, builder); the raw patterns double as the
+# branches of the combined alternation below.
+_SPECS = [
     # PATROL must come before MOVE_TO so "patrol between X and Y" isn't
     # partially eaten by the move pattern.
     # Now supports: "patrol between X and Y", "go back and forth between X and Y",
     # "circle between X and Y", "patrol from X to Y"
     (
-        re.compile(
-            rf"{_PATROL_VERBS}\s+{_BETWEEN_PREP}\s+{_CELL}\s+{_AND_CONJ}\s+{_CELL}",
-            re.IGNORECASE,
-        ),
+        "patrol",
+        rf"{_PATROL_VERBS}\s+{_BETWEEN_PREP}\s+{_cell('pa')}\s+{_AND_CONJ}\s+{_cell('pb')}",
         lambda m: ParsedCommand(
             CommandType.PATROL,
-            {"cell_a": m.group(1).upper(), "cell_b": m.group(2).upper()},
+            {"cell_a": m["pa"].upper(), "cell_b": m["pb"].upper()},
         ),
     ),
     # GUARD with more flexible phrasing
     # Supports: "guard E5", "defend position E5", "hold E5", "protect cell E5"
     (
-        re.compile(
-            rf"{_GUARD_VERBS}\s+(?:(?:position|area|spot|point|the)\s+)?(?:{_TO_PREP}\s+)?{_CELL}",
-            re.IGNORECASE,
-        ),
+        "guard",
+        rf"{_GUARD_VERBS}\s+(?:(?:position|area|spot|point|the)\s+)?(?:{_TO_PREP}\s+)?{_cell('gc')}",
         lambda m: ParsedCommand(
             CommandType.GUARD,
-            {"cell": m.group(1).upper()},
+            {"cell": m["gc"].upper()},
         ),
     ),
     # MOVE_TO with synonym support
     # Supports: "move to X", "go to X", "navigate to X", "head towards X", "advance to X"
     (
-        re.compile(
-            rf"{_MOVE_VERBS}\s+{_TO_PREP}\s+{_CELL}",
-            re.IGNORECASE,
-        ),
+        "move",
+        rf"{_MOVE_VERBS}\s+{_TO_PREP}\s+{_cell('mc')}",
         lambda m: ParsedCommand(
             CommandType.MOVE_TO,
-            {"cell": m.group(1).upper()},
+            {"cell": m["mc"].upper()},
         ),
     ),
     # FACE with more direction options
     # Supports: "face north", "turn east", "rotate west", "look northeast"
     # Also accepts full words: northeast, northwest, southeast, southwest
     (
-        re.compile(
-            rf"{_FACE_VERBS}\s+(north(?:east)?|south(?:east)?|east|west|ne|nw|se|sw|[nsew])\b",
-            re.IGNORECASE,
-        ),
+        "face",
+        rf"{_FACE_VERBS}\s+(?P<fdir>north(?:east)?|south(?:east)?|east|west|ne|nw|se|sw|[nsew])\b",
         lambda m: ParsedCommand(
             CommandType.FACE,
-            {"direction": resolve_compass(m.group(1))},
+            {"direction": resolve_compass(m["fdir"])},
         ),
     ),
     # SHOOT_ON_SIGHT with more flexible phrasing
     # Supports: "shoot at anything in sight", "fire at enemies", "attack targets on sight",
     # "engage enemies in view", "shoot on contact"
     (
-        re.compile(
-            rf"{_SHOOT_VERBS}\s+(?:at\s+)?(?:any(?:thing|one)?|enemies?|targets?|hostiles?|contacts?|opponents?).*?(?:(?:in|on|within)\s+)?(?:your\s+)?(?:sight|view|range|contact)",
-            re.IGNORECASE,
-        ),
+        "sos",
+        rf"{_SHOOT_VERBS}\s+(?:at\s+)?(?:any(?:thing|one)?|enemies?|targets?|hostiles?|contacts?|opponents?).*?(?:(?:in|on|within)\s+)?(?:your\s+)?(?:sight|view|range|contact)",
         lambda m: ParsedCommand(CommandType.SHOOT_ON_SIGHT),
     ),
     # Bare shoot command with synonym support
     # Supports: "shoot", "fire", "attack"
     (
-        re.compile(rf"\b{_SHOOT_VERBS}\b", re.IGNORECASE),
+        "shoot",
+        rf"\b{_SHOOT_VERBS}\b",
         lambda m: ParsedCommand(CommandType.SHOOT_ONCE),
     ),
 ]
 
+_PATTERNS = [
+    (re.compile(raw, re.IGNORECASE), builder) for _, raw, builder in _SPECS
+]
+_BUILDERS = {name: builder for name, _, builder in _SPECS}
+_SPEC_ORDER = {name: i for i, (name, _, _) in enumerate(_SPECS)}
+# One alternation over every category — parse_command scans the input
+# once at C level instead of running each category's search separately.
+# Branch order mirrors _SPECS, so patrol still wins over move at the
+# same position.
+_COMBINED = re.compile(
+    "|".join(rf"(?P<{name}>{raw})" for name, raw, _ in _SPECS),
+    re.IGNORECASE,
+)
+
 
 def _validate_cell(cell: str) -> bool:
     """Validate that a cell reference is within arena bounds.
@@ -170,23 +182,25 @@ def parse_command(text: str) -> List[ParsedCommand]:
         "Patrol between B2 and B9 and shoot at anything in your sight"
         → [PATROL(B2, B9), SHOOT_ON_SIGHT]
 
-    The parser greedily matches the longest patterns first, strips them
-    from the remaining text, then splits on ' and ' to find additional
-    commands.
+    The parser matches every category in a single pass over the text
+    with the combined alternation (first match wins per category,
+    results ordered by category priority), then splits on ' and ' to
+    find additional commands if nothing matched.
 
     Cell coordinates are validated (A-R, 1-12). Invalid commands are
     silently filtered out.
     """
-    results: List[ParsedCommand] = []
-    remaining = text.strip()
-
-    # Greedily match known patterns
-    for regex, builder in _PATTERNS:
-        m = regex.search(remaining)
-        if m:
-            results.append(builder(m))
-            # Remove matched span so it doesn't interfere with further parsing
-            remaining = remaining[:m.start()] + remaining[m.end():]
+    # Single scan: finditer walks the text once and yields non-
+    # overlapping matches, which replaces the old search-per-category
+    # loop (and its span-stripping) with one C-level pass.
+    matched: Dict[str, re.Match] = {}
+    for m in _COMBINED.finditer(text.strip()):
+        name = next(n for n in _SPEC_ORDER if m.group(n) is not None)
+        matched.setdefault(name, m)
+    results: List[ParsedCommand] = [
+        _BUILDERS[name](m)
+        for name, m in sorted(matched.items(), key=lambda kv: _SPEC_ORDER[kv[0]])
+    ]
 
     # If nothing matched from the full text, try splitting on ' and '
     # (handles edge cases where the first pass missed fragments).
@@ -234,6 +248,12 @@ _AIM_THRESHOLD = 8.0    # degrees — start moving forward once roughly aimed
 _MOVE_ANGLE = 30.0      # degrees — max angle error while still advancing
 _SHOOT_AIM = 5.0        # degrees — precision needed to fire (looking right at target)
 
+# Shared idle result — callers only iterate tick() output, never mutate it
+_STOP_RESULT = [TankCommand.STOP]
+
+# Bound once for the per-tick aim math (same idiom as navigation.py)
+_radians, _sin, _cos = math.radians, math.sin, math.cos
+
 
 class CommandExecutor:
     """Holds active commands for a single tank and emits TankCommand lists each tick."""
@@ -241,128 +261,174 @@ class CommandExecutor:
     def __init__(self, level=None) -> None:
         self.commands: List[ParsedCommand] = []
         self._patrol_idx: int = 0       # which waypoint we're heading toward
-        self._completed: set = set()    # indices of completed one-time commands
         self._level = level             # Level for obstacle avoidance (None = disabled)
         self._avoider = ObstacleAvoider() if level is not None else None
+        # Pending commands in text order; completed one-time commands
+        # are removed rather than tracked in a side set
+        self._plan: List[ParsedCommand] = []
+        self._has_sos: bool = False
+        # Reused between ticks — the returned list is only valid until
+        # the next tick() call on this executor
+        self._result_buf: List[TankCommand] = []
+
+    @property
+    def active(self) -> bool:
+        """Whether any commands are loaded and tick() should be called."""
+        return bool(self.commands)
 
     def set_commands(self, commands: List[ParsedCommand]) -> None:
-        """Replace all active commands (called at scenario start)."""
+        """Replace all active commands (called at scenario start).
+
+        Cell targets are resolved to pixel coordinates and compass
+        directions to angles here, once per strategy change, so the
+        30 Hz executors read precomputed values instead of re-deriving
+        them every tick (same precompute-at-load idea as
+        SpawnPoint.px/py).
+        """
         self.commands = list(commands)
+        for cmd in self.commands:
+            params = cmd.params
+            if cmd.type in (CommandType.MOVE_TO, CommandType.GUARD):
+                params["_xy"] = cell_to_pixel(params["cell"])
+            elif cmd.type == CommandType.PATROL:
+                params["_xy_a"] = cell_to_pixel(params["cell_a"])
+                params["_xy_b"] = cell_to_pixel(params["cell_b"])
+            elif cmd.type == CommandType.FACE:
+                params["_angle"] = COMPASS_ANGLES.get(params["direction"], 0)
+        self._plan = list(self.commands)
+        self._has_sos = any(
+            c.type == CommandType.SHOOT_ON_SIGHT for c in self.commands
+        )
         self._patrol_idx = 0
-        self._completed = set()
+        if self._avoider is not None:
+            self._avoider.reset()
+
+    def clear(self) -> None:
+        """Drop all commands, leaving the executor idle but reusable.
+
+        Lets the game loop keep one executor per player for the whole
+        session instead of allocating a fresh one on every strategy
+        change or clear.
+        """
+        self.set_commands([])
 
     def tick(self, me: dict, enemy: dict) -> List[TankCommand]:
         """Produce a list of TankCommand enums for this frame.
 
+        The returned list is reused between calls: consume or copy it
+        before the next tick() on this executor. Every caller drains
+        it into a queue or applies it immediately, so nothing holds a
+        reference across frames.
+
         Args:
             me: Snapshot dict of this tank (x, y, angle, health, alive).
             enemy: Snapshot dict of the opposing tank.
         """
         if not me.get("alive", False):
-            return [TankCommand.STOP]
+            return _STOP_RESULT
 
-        # Pre-check: if SHOOT_ON_SIGHT is active and enemy is visible,
-        # the tank should prioritise engaging over movement.
-        engaging = False
-        for cmd in self.commands:
-            if cmd.type == CommandType.SHOOT_ON_SIGHT:
-                engage_cmds = self._exec_shoot_on_sight(me, enemy)
-                if engage_cmds:
-                    engaging = True
-                break
+        # Unpack own pose once; the per-command executors take these
+        # scalars instead of each re-hashing the snapshot dict
+        mx, my, ma = me["x"], me["y"], me["angle"]
 
-        result: List[TankCommand] = []
+        # Pre-check: if SHOOT_ON_SIGHT is active and enemy is visible,
+        # the tank should prioritise engaging over movement. The result
+        # is kept and replayed at the SHOOT_ON_SIGHT entry below so the
+        # sight check and aim trig run once per tick, not twice.
+        engage_cmds: Optional[List[TankCommand]] = None
+        if self._has_sos:
+            engage_cmds = self._exec_shoot_on_sight(me, enemy, mx, my, ma)
+        engaging = bool(engage_cmds)
+
+        result = self._result_buf
+        result.clear()
         has_movement = False
+        finished: List[ParsedCommand] = []
 
-        for i, cmd in enumerate(self.commands):
-            if i in self._completed:
-                continue
-
+        for cmd in self._plan:
             if cmd.type == CommandType.MOVE_TO:
                 if not has_movement and not engaging:
-                    cmds, done = self._exec_move_to(me, cmd)
+                    cmds, done = self._exec_move_to(mx, my, ma, cmd)
                     result.extend(cmds)
                     has_movement = True
                     if done:
-                        self._completed.add(i)
+                        finished.append(cmd)
 
             elif cmd.type == CommandType.PATROL:
                 if not has_movement and not engaging:
-                    result.extend(self._exec_patrol(me, cmd))
+                    result.extend(self._exec_patrol(mx, my, ma, cmd))
                     has_movement = True
 
             elif cmd.type == CommandType.GUARD:
                 if not has_movement and not engaging:
-                    result.extend(self._exec_guard(me, enemy, cmd))
+                    result.extend(
+                        self._exec_guard(me, enemy, mx, my, ma, cmd))
                     has_movement = True
 
             elif cmd.type == CommandType.FACE:
                 if not engaging:
-                    cmds, done = self._exec_face(me, cmd)
+                    cmds, done = self._exec_face(ma, cmd)
                     result.extend(cmds)
                     if done:
-                        self._completed.add(i)
+                        finished.append(cmd)
 
             elif cmd.type == CommandType.SHOOT_ONCE:
                 result.append(TankCommand.SHOOT)
-                self._completed.add(i)
+                finished.append(cmd)
 
             elif cmd.type == CommandType.SHOOT_ON_SIGHT:
-                result.extend(self._exec_shoot_on_sight(me, enemy))
+                if engage_cmds:
+                    result.extend(engage_cmds)
+
+        for cmd in finished:
+            self._plan.remove(cmd)
 
-        return result if result else [TankCommand.STOP]
+        return result if result else _STOP_RESULT
 
     # ---- Per-command executors ----
 
-    def _exec_move_to(self, me: dict, cmd: ParsedCommand):
+    def _exec_move_to(self, mx: float, my: float, ma: float,
+                      cmd: ParsedCommand):
         """Navigate toward a single cell. Returns (commands, is_done)."""
-        tx, ty = cell_to_pixel(cmd.params["cell"])
-        return self._navigate_toward(me, tx, ty, stop_on_arrive=True)
+        tx, ty = cmd.params["_xy"]
+        return self._navigate_toward(mx, my, ma, tx, ty, stop_on_arrive=True)
 
-    def _exec_patrol(self, me: dict, cmd: ParsedCommand) -> List[TankCommand]:
+    def _exec_patrol(self, mx: float, my: float, ma: float,
+                     cmd: ParsedCommand) -> List[TankCommand]:
         """Move toward current patrol waypoint; flip on arrival."""
-        cells = [cmd.params["cell_a"], cmd.params["cell_b"]]
-        target_cell = cells[self._patrol_idx % 2]
-        tx, ty = cell_to_pixel(target_cell)
+        tx, ty = cmd.params["_xy_a" if self._patrol_idx % 2 == 0 else "_xy_b"]
 
-        cmds, arrived = self._navigate_toward(me, tx, ty, stop_on_arrive=False)
+        cmds, arrived = self._navigate_toward(mx, my, ma, tx, ty,
+                                              stop_on_arrive=False)
         if arrived:
             self._patrol_idx += 1
         return cmds
 
     def _exec_guard(self, me: dict, enemy: dict,
+                    mx: float, my: float, ma: float,
                     cmd: ParsedCommand) -> List[TankCommand]:
-        """Hold a position; shoot enemies that come into view."""
-        gx, gy = cell_to_pixel(cmd.params["cell"])
-        dist_to_post = distance(me["x"], me["y"], gx, gy)
+        """Hold a position; shoot enemies that come into view.
+
+        Takes both the snapshot dicts (for is_in_sight) and the
+        already-unpacked own pose scalars.
+        """
+        gx, gy = cmd.params["_xy"]
+        dist_to_post = distance(mx, my, gx, gy)
 
         # If far from guard position, navigate toward it
         if dist_to_post > _ARRIVE_DIST * 1.6:
-            cmds, _ = self._navigate_toward(me, gx, gy, stop_on_arrive=False)
+            cmds, _ = self._navigate_toward(mx, my, ma, gx, gy,
+                                            stop_on_arrive=False)
             # Still check for enemies while moving
             if is_in_sight(me, enemy, level=self._level):
-                # Aim from bullet spawn position to enemy center mass
-                rad = math.radians(me["angle"])
-                spawn_dist = CELL_SIZE * 0.45
-                bullet_x = me["x"] + math.sin(rad) * spawn_dist
-                bullet_y = me["y"] - math.cos(rad) * spawn_dist
-                desired = angle_to_target(bullet_x, bullet_y,
-                                          enemy["x"], enemy["y"])
-                err = angle_error(desired, me["angle"])
+                err = self._aim_error(mx, my, ma, enemy["x"], enemy["y"])
                 if abs(err) < _SHOOT_AIM:
                     cmds.append(TankCommand.SHOOT)
             return cmds
 
         # At guard post — scan for enemy
         if enemy.get("alive") and is_in_sight(me, enemy, level=self._level):
-            # Aim from bullet spawn position to enemy center mass
-            rad = math.radians(me["angle"])
-            spawn_dist = CELL_SIZE * 0.45
-            bullet_x = me["x"] + math.sin(rad) * spawn_dist
-            bullet_y = me["y"] - math.cos(rad) * spawn_dist
-            desired = angle_to_target(bullet_x, bullet_y,
-                                      enemy["x"], enemy["y"])
-            err = angle_error(desired, me["angle"])
+            err = self._aim_error(mx, my, ma, enemy["x"], enemy["y"])
             cmds: List[TankCommand] = []
             if abs(err) > _AIM_THRESHOLD:
                 cmds.append(
@@ -375,17 +441,17 @@ class CommandExecutor:
 
         return [TankCommand.STOP]
 
-    def _exec_face(self, me: dict, cmd: ParsedCommand):
+    def _exec_face(self, ma: float, cmd: ParsedCommand):
         """Rotate to face a compass direction. Returns (commands, is_done)."""
-        direction = cmd.params["direction"]
-        target_angle = COMPASS_ANGLES.get(direction, 0)
-        err = angle_error(target_angle, me["angle"])
+        err = angle_error(cmd.params["_angle"], ma)
         if abs(err) < 5.0:
             return ([TankCommand.STOP], True)
         cmd_rot = TankCommand.ROTATE_RIGHT if err > 0 else TankCommand.ROTATE_LEFT
         return ([cmd_rot], False)
 
-    def _exec_shoot_on_sight(self, me: dict, enemy: dict) -> List[TankCommand]:
+    def _exec_shoot_on_sight(self, me: dict, enemy: dict,
+                             mx: float, my: float,
+                             ma: float) -> List[TankCommand]:
         """Turn toward and fire at enemy when within the FOV cone.
 
         While engaging, the tank also creeps forward (at shoot-slowdown
@@ -394,15 +460,7 @@ class CommandExecutor:
         if not is_in_sight(me, enemy, level=self._level):
             return []
 
-        # Calculate aim angle from bullet spawn position to enemy center mass
-        # This accounts for the 45-pixel barrel offset and ensures accurate center-mass targeting
-        rad = math.radians(me["angle"])
-        spawn_dist = CELL_SIZE * 0.45
-        bullet_x = me["x"] + math.sin(rad) * spawn_dist
-        bullet_y = me["y"] - math.cos(rad) * spawn_dist
-        desired = angle_to_target(bullet_x, bullet_y, enemy["x"], enemy["y"])
-
-        err = angle_error(desired, me["angle"])
+        err = self._aim_error(mx, my, ma, enemy["x"], enemy["y"])
         cmds: List[TankCommand] = []
         if abs(err) > _AIM_THRESHOLD:
             cmds.append(
@@ -415,12 +473,32 @@ class CommandExecutor:
         cmds.append(TankCommand.FORWARD)
         return cmds
 
-    # ---- Shared navigation helper ----
+    # ---- Shared aim/navigation helpers ----
+
+    @staticmethod
+    def _aim_error(mx: float, my: float, ma: float,
+                   ex: float, ey: float) -> float:
+        """Signed aim error in degrees toward the enemy's center mass.
 
-    def _navigate_toward(self, me: dict, tx: float, ty: float,
-                         stop_on_arrive: bool):
-        """Steer toward (tx, ty). Returns (commands, arrived_bool)."""
-        dist = distance(me["x"], me["y"], tx, ty)
+        Takes plain scalars (own position/angle, enemy position) like
+        navigation's aim_and_fire, keeping the kernel free of snapshot
+        dict lookups. Measured from the bullet spawn point rather than
+        the hull center, which accounts for the 45-pixel barrel offset.
+        """
+        rad = _radians(ma)
+        spawn_dist = CELL_SIZE * 0.45
+        bullet_x = mx + _sin(rad) * spawn_dist
+        bullet_y = my - _cos(rad) * spawn_dist
+        desired = angle_to_target(bullet_x, bullet_y, ex, ey)
+        return angle_error(desired, ma)
+
+    def _navigate_toward(self, mx: float, my: float, ma: float,
+                         tx: float, ty: float, stop_on_arrive: bool):
+        """Steer from (mx, my) facing *ma* toward (tx, ty).
+
+        Returns (commands, arrived_bool).
+        """
+        dist = distance(mx, my, tx, ty)
         if dist <= _ARRIVE_DIST:
             if stop_on_arrive:
                 return ([TankCommand.STOP], True)
@@ -429,14 +507,12 @@ class CommandExecutor:
         # Obstacle avoidance: if a level is available, check for obstacles
         # ahead and steer around them before falling back to normal aiming.
         if self._avoider is not None:
-            avoidance = self._avoider(
-                me["x"], me["y"], me["angle"], self._level, tx, ty,
-            )
+            avoidance = self._avoider(mx, my, ma, self._level, tx, ty)
             if avoidance is not None:
                 return (avoidance, False)
 
-        desired = angle_to_target(me["x"], me["y"], tx, ty)
-        err = angle_error(desired, me["angle"])
+        desired = angle_to_target(mx, my, tx, ty)
+        err = angle_error(desired, ma)
 
         cmds: List[TankCommand] = []
         if abs(err) > _AIM_THRESHOLD:
@@ -1,5 +1,8 @@
+import math
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import List
 
 # ---- Window & Grid ----
 WINDOW_WIDTH = 1800
@@ -99,6 +102,13 @@ TANK_SPEED = 6.0          # pixels per frame
 TANK_ROTATION_SPEED = 3.0 # degrees per frame
 TANK_HITBOX_HALF = 36     # half-width of square collision box
 
+# Heading angles only occur in whole-degree steps (rotation moves in
+# TANK_ROTATION_SPEED multiples from integer spawn facings), so the
+# per-frame movement/spawn trig is two tuple loads instead of two libm
+# calls: SIN_DEG[int(angle) % 360]
+SIN_DEG = tuple(math.sin(math.radians(a)) for a in range(360))
+COS_DEG = tuple(math.cos(math.radians(a)) for a in range(360))
+
 # ---- Bullet Physics ----
 BULLET_SPEED = 20.0
 BULLET_COOLDOWN_MS = 400  # ms between shots
@@ -114,6 +124,11 @@ FACING_TO_ANGLE = {
 }
 
 
+# ---- Sight / Targeting ----
+MAX_SIGHT_RANGE = 1200.0  # pixels (12 cells) — beyond this, skip sight checks
+MAX_SIGHT_R2 = MAX_SIGHT_RANGE * MAX_SIGHT_RANGE
+
+
 # ---- Health & Damage ----
 TANK_MAX_HEALTH = 3
 BULLET_DAMAGE = 1
@@ -147,6 +162,23 @@ class TankCommand(Enum):
     AUTO_SHOOT_OFF = "auto_shoot_off"
 
 
+# ---- Command-queue protocol objects ----
+# Strategy messages travel the same queues as TankCommand enums. Typed
+# objects let the drain loops dispatch on an exact type() check instead
+# of isinstance(tuple) + string compares per item.
+
+@dataclass(frozen=True, slots=True)
+class StrategyCmd:
+    """A parsed natural-language strategy for a tank."""
+    text: str
+    parsed: List
+
+
+@dataclass(frozen=True, slots=True)
+class ClearStrategyCmd:
+    """Clear the active strategy for a tank."""
+
+
 # ---- API Server ----
 API_HOST = "0.0.0.0"
 API_PORT = 8080
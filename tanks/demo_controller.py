@@ -5,9 +5,10 @@ assigns a natural-language command string to both tanks, parses them
 into high-level commands, and executes them tick-by-tick until the
 scenario duration elapses or a tank dies.
 
-The main game loop checks ``_request_reset`` each frame to know when
-to respawn tanks for the next scenario.
+The main game loop checks the ``_reset_request`` event each frame to
+know when to respawn tanks for the next scenario.
 """
+import threading
 import time
 from queue import Queue
 from typing import List
@@ -45,6 +46,13 @@ DEMO_SCENARIOS: List[dict] = [
     },
 ]
 
+# Parsed once at import — the scenario strings are fixed literals, so
+# re-parsing them on every cycle through the rotation was pure waste
+_PARSED_SCENARIOS = [
+    (parse_command(s["blue"]), parse_command(s["red"]))
+    for s in DEMO_SCENARIOS
+]
+
 
 class DemoController:
     """Scenario sequencer for demo mode.
@@ -69,7 +77,16 @@ class DemoController:
         self._running = False
         self.current_scenario_index: int = 0
         self.scenario_display: dict = {}
-        self._request_reset: bool = False
+        # Reset handshake: the controller (or the main loop, when a
+        # demo tank dies) sets _reset_request; the main loop respawns
+        # tanks, clears it and sets _reset_done as acknowledgement —
+        # replaces the old 50 ms snapshot-polling handshake
+        self._reset_request = threading.Event()
+        self._reset_done = threading.Event()
+        # One executor per tank for the controller's lifetime; each
+        # scenario swaps commands in via set_commands()
+        self._blue_exec = CommandExecutor(level=level)
+        self._red_exec = CommandExecutor(level=level)
 
     def start(self) -> None:
         """Begin the demo loop. Call from a daemon thread."""
@@ -85,45 +102,52 @@ class DemoController:
             scenario = DEMO_SCENARIOS[self.current_scenario_index]
             self.scenario_display = scenario
 
-            # Parse commands for both tanks
-            blue_exec = CommandExecutor(level=self.level)
-            blue_exec.set_commands(parse_command(scenario["blue"]))
-            red_exec = CommandExecutor(level=self.level)
-            red_exec.set_commands(parse_command(scenario["red"]))
-
-            # Signal the main loop to respawn tanks
-            self._request_reset = True
-
-            # Wait until the main loop has reset and entered playing phase
-            while self._running:
-                snap = self.game_state.snapshot()
-                if snap["phase"] == "playing" and not self._request_reset:
-                    break
-                time.sleep(0.05)
-
-            # Execute scenario
-            start_time = time.time()
+            # Load the pre-parsed commands for both tanks
+            blue_cmds, red_cmds = _PARSED_SCENARIOS[self.current_scenario_index]
+            blue_exec = self._blue_exec
+            blue_exec.set_commands(blue_cmds)
+            red_exec = self._red_exec
+            red_exec.set_commands(red_cmds)
+
+            # Signal the main loop to respawn tanks, then wait for its
+            # acknowledgement instead of polling snapshots
+            self._reset_done.clear()
+            self._reset_request.set()
+            while self._running and not self._reset_done.wait(timeout=0.5):
+                pass
+
+            # Execute scenario — deadline-paced on the monotonic clock,
+            # so ticks don't drift with work time or NTP adjustments
+            start_time = time.monotonic()
+            deadline = start_time
             while self._running:
                 snap = self.game_state.snapshot()
                 if snap["phase"] != "playing":
                     break
 
-                elapsed = time.time() - start_time
-                if elapsed >= scenario["duration"]:
+                if time.monotonic() - start_time >= scenario["duration"]:
                     break
 
                 me_blue = snap["tanks"].get("player1")
                 me_red = snap["tanks"].get("player2")
 
                 if me_blue and me_blue.get("alive"):
-                    for cmd in blue_exec.tick(me_blue, me_red or {}):
-                        self.p1_queue.put(cmd)
+                    cmds = blue_exec.tick(me_blue, me_red or {})
+                    if cmds:
+                        self.p1_queue.put_many(cmds)
 
                 if me_red and me_red.get("alive"):
-                    for cmd in red_exec.tick(me_red, me_blue or {}):
-                        self.p2_queue.put(cmd)
-
-                time.sleep(self.TICK_INTERVAL)
+                    cmds = red_exec.tick(me_red, me_blue or {})
+                    if cmds:
+                        self.p2_queue.put_many(cmds)
+
+                deadline += self.TICK_INTERVAL
+                slack = deadline - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    # Fell behind — rebase instead of storming to catch up
+                    deadline = time.monotonic()
 
             # Advance to next scenario (cycle)
             self.current_scenario_index = (
@@ -4,30 +4,17 @@ Provides thread-safe logging of all commands sent to tanks and periodic
 snapshots of game state. Designed to be queried via API endpoints.
 """
 import time
-import threading
+from bisect import bisect_left
 from collections import deque
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Optional
 
+# Ticks between periodic snapshots (~3.3 seconds at 30 FPS). Exposed at
+# module level so the game loops can run their own cooldown counter
+# instead of calling should_snapshot() every frame.
+SNAPSHOT_INTERVAL = 100
 
-@dataclass
-class CommandLogEntry:
-    """A single command log entry."""
-    timestamp: float
-    tick: int
-    player: str
-    command: str
-    command_type: str  # "direct" or "strategy"
-
-
-@dataclass
-class SnapshotLogEntry:
-    """A periodic snapshot of game state."""
-    timestamp: float
-    tick: int
-    tanks: Dict
-    phase: str
-    mode: Optional[str]
+_TICK = itemgetter("tick")
 
 
 class GameHistory:
@@ -37,7 +24,13 @@ class GameHistory:
     - All commands sent to tanks
     - Periodic snapshots of game state (every 100 ticks / ~3.3 seconds at 30 FPS)
 
-    Uses circular buffers (deques) to automatically evict old entries when full.
+    Uses circular buffers (deques) to automatically evict old entries when
+    full. Entries are stored as the JSON-ready dicts get_history() hands
+    out, so the export path is a slice, not a per-entry conversion.
+
+    Thread safety comes from the deques themselves: append() and
+    list(deque) are atomic under the GIL, so the logging hot path takes
+    no lock at all and never contends with get_history() readers.
     """
 
     def __init__(self, max_commands: int = 1000, max_snapshots: int = 100):
@@ -49,9 +42,20 @@ class GameHistory:
         """
         self._commands = deque(maxlen=max_commands)
         self._snapshots = deque(maxlen=max_snapshots)
-        self._lock = threading.Lock()
         self._last_snapshot_tick = 0
-        self._snapshot_interval = 100  # ~3.3 seconds at 30 FPS
+        self._snapshot_interval = SNAPSHOT_INTERVAL
+
+    def reset(self) -> None:
+        """Drop all history at the start of a new game.
+
+        Ticks restart at 0 with each game, so letting entries from the
+        previous game linger would break the tick ordering that
+        get_history()'s bisect filtering relies on (and make
+        since_tick queries silently drop current-game entries).
+        """
+        self._commands.clear()
+        self._snapshots.clear()
+        self._last_snapshot_tick = 0
 
     def log_command(self, tick: int, player: str, command: str, command_type: str) -> None:
         """Log a command sent to a tank.
@@ -62,15 +66,14 @@ class GameHistory:
             command: Command value or strategy text
             command_type: "direct" or "strategy"
         """
-        entry = CommandLogEntry(
-            timestamp=time.time(),
-            tick=tick,
-            player=player,
-            command=command,
-            command_type=command_type,
-        )
-        with self._lock:
-            self._commands.append(entry)
+        entry = {
+            "timestamp": time.time(),
+            "tick": tick,
+            "player": player,
+            "command": command,
+            "command_type": command_type,
+        }
+        self._commands.append(entry)  # atomic; no lock needed
 
     def log_snapshot(self, tick: int, game_state_snapshot: dict) -> None:
         """Log a periodic snapshot of game state.
@@ -79,16 +82,15 @@ class GameHistory:
             tick: Current game tick number
             game_state_snapshot: Full game state from GameState.snapshot()
         """
-        entry = SnapshotLogEntry(
-            timestamp=time.time(),
-            tick=tick,
-            tanks=game_state_snapshot.get("tanks", {}),
-            phase=game_state_snapshot.get("phase", "UNKNOWN"),
-            mode=game_state_snapshot.get("mode"),
-        )
-        with self._lock:
-            self._snapshots.append(entry)
-            self._last_snapshot_tick = tick
+        entry = {
+            "timestamp": time.time(),
+            "tick": tick,
+            "tanks": game_state_snapshot.get("tanks", {}),
+            "phase": game_state_snapshot.get("phase", "UNKNOWN"),
+            "mode": game_state_snapshot.get("mode"),
+        }
+        self._snapshots.append(entry)  # atomic; no lock needed
+        self._last_snapshot_tick = tick
 
     def should_snapshot(self, current_tick: int) -> bool:
         """Check if it's time to take a snapshot.
@@ -115,34 +117,34 @@ class GameHistory:
         Returns:
             Dictionary with commands, snapshots, and metadata
         """
-        with self._lock:
-            # Filter and convert commands
-            commands = list(self._commands)
-            if since_tick is not None:
-                commands = [c for c in commands if c.tick >= since_tick]
-            if limit is not None:
-                commands = commands[-limit:]
-
-            # Filter and convert snapshots
-            snapshots = list(self._snapshots)
-            if since_tick is not None:
-                snapshots = [s for s in snapshots if s.tick >= since_tick]
-            if limit is not None:
-                snapshots = snapshots[-limit:]
-
-            # Calculate metadata
-            all_ticks = (
-                [c.tick for c in self._commands]
-                + [s.tick for s in self._snapshots]
-            )
-            oldest_tick = min(all_ticks) if all_ticks else 0
-            newest_tick = max(all_ticks) if all_ticks else 0
-
-            return {
-                "commands": [asdict(c) for c in commands],
-                "snapshots": [asdict(s) for s in snapshots],
-                "total_commands": len(commands),
-                "total_snapshots": len(snapshots),
-                "oldest_tick": oldest_tick,
-                "newest_tick": newest_tick,
-            }
+        # Copy both buffers atomically, then filter and slice the
+        # copies — entries are stored tick-ordered, so since_tick is a
+        # bisect over the snapshot instead of a full scan. The buffers
+        # only ever hold one game's entries (reset() clears them when a
+        # new game starts), so the order always holds.
+        commands = list(self._commands)
+        snapshots = list(self._snapshots)
+
+        # Tick order also makes the metadata O(1): oldest/newest are the
+        # ends of each buffer rather than a min/max over everything
+        edge_ticks = [e["tick"] for e in (
+            commands[:1] + commands[-1:] + snapshots[:1] + snapshots[-1:]
+        )]
+        oldest_tick = min(edge_ticks) if edge_ticks else 0
+        newest_tick = max(edge_ticks) if edge_ticks else 0
+
+        if since_tick is not None:
+            commands = commands[bisect_left(commands, since_tick, key=_TICK):]
+            snapshots = snapshots[bisect_left(snapshots, since_tick, key=_TICK):]
+        if limit is not None:
+            commands = commands[-limit:]
+            snapshots = snapshots[-limit:]
+
+        return {
+            "commands": commands,
+            "snapshots": snapshots,
+            "total_commands": len(commands),
+            "total_snapshots": len(snapshots),
+            "oldest_tick": oldest_tick,
+            "newest_tick": newest_tick,
+        }
@@ -3,6 +3,7 @@ import threading
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
+from tanks.bullets import BULLETS
 from tanks.constants import GamePhase, GameMode, TANK_MAX_HEALTH
 
 
@@ -31,11 +32,28 @@ class GameState:
     )
     demo: Optional[Dict] = None
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # Last built snapshot and the (tick, phase) it was built for —
+    # readers on other threads get the cached dict back without
+    # re-serializing until the game loop advances
+    _snap_cache: Optional[dict] = field(default=None, repr=False)
+    _snap_key: tuple = field(default=(None, None), repr=False)
+    # Whether the last update_tanks call saw live bullets — used to
+    # publish one final rebuild after the pool empties
+    _had_bullets: bool = field(default=False, repr=False)
 
     def snapshot(self) -> dict:
-        """Return a JSON-serializable dictionary of the full game state."""
+        """Return a JSON-serializable dictionary of the full game state.
+
+        The result is shared between callers until the next frame
+        (keyed on tick and phase, the same change marker the WebSocket
+        push uses) — treat it as read-only.
+        """
+        key = (self.tick, self.phase)
+        cached = self._snap_cache
+        if cached is not None and self._snap_key == key:
+            return cached
         with self._lock:
-            return {
+            snap = {
                 "phase": self.phase.value,
                 "mode": self.mode.value if self.mode else None,
                 "tick": self.tick,
@@ -55,6 +73,9 @@ class GameState:
                 "strategies": dict(self.strategies),
                 "demo": dict(self.demo) if self.demo else None,
             }
+            self._snap_cache = snap
+            self._snap_key = key
+            return snap
 
     def set_strategy(self, player: str, text: Optional[str]) -> None:
         """Set the active natural language strategy for a player."""
@@ -64,15 +85,48 @@ class GameState:
     def update_tank(self, name: str, tank) -> None:
         """Update a tank's entry from a Tank object. Called by game loop."""
         with self._lock:
-            self.tanks[name] = TankState(
-                color=tank.color,
-                x=tank.x,
-                y=tank.y,
-                angle=tank.angle,
-                health=tank.health,
-                alive=tank.alive,
-                bullets=[
-                    {"x": round(b.x, 1), "y": round(b.y, 1), "angle": round(b.angle, 1)}
-                    for b in tank.bullets
-                ],
-            )
+            self.tanks[name] = _tank_state(tank)
+
+    def update_tanks(self, tanks: Dict[str, object]) -> None:
+        """Update several tanks' entries under a single lock acquisition.
+
+        Preferred over repeated update_tank() calls on the per-frame
+        path: one critical section instead of one per tank, halving
+        lock traffic against the API/AI reader threads.
+
+        Clean tanks are skipped entirely while no bullets are in
+        flight: a tank that processed no movement, shot or hit since
+        its last publish has an identical TankState, and the bullet
+        lists (the one part that changes without the tank moving) are
+        empty on both sides. Idle frames then cost two flag reads.
+
+        The frame after the pool empties still rebuilds every tank
+        once — BULLETS.step() culls before this runs, so without that
+        extra pass the published states would keep the dead bullet's
+        last position forever.
+        """
+        n = BULLETS.count
+        rebuild_all = bool(n) or self._had_bullets
+        self._had_bullets = bool(n)
+        states = {}
+        for name, tank in tanks.items():
+            if tank._dirty or rebuild_all:
+                states[name] = _tank_state(tank)
+                tank._dirty = False
+        if not states:
+            return
+        with self._lock:
+            self.tanks.update(states)
+
+
+def _tank_state(tank) -> TankState:
+    """Build a TankState snapshot from a live Tank object."""
+    return TankState(
+        color=tank.color,
+        x=tank.x,
+        y=tank.y,
+        angle=tank.angle,
+        health=tank.health,
+        alive=tank.alive,
+        bullets=BULLETS.bullets_for(tank.owner),
+    )
@@ -3,9 +3,12 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
+import numpy as np
+
 from tanks.constants import (
     TerrainType, ObstacleType, Facing,
     OBSTACLE_DEFS, OBSTACLE_BLOCKS,
+    CELL_SIZE, FACING_TO_ANGLE,
 )
 
 
@@ -23,6 +26,16 @@ class SpawnPoint:
     col: int
     row: int
     facing: Facing
+    # Derived once at load time so respawns (every demo scenario) don't
+    # redo the cell-to-pixel and facing-to-angle math
+    px: float = field(init=False)
+    py: float = field(init=False)
+    angle: float = field(init=False)
+
+    def __post_init__(self):
+        self.px = self.col * CELL_SIZE + CELL_SIZE // 2
+        self.py = self.row * CELL_SIZE + CELL_SIZE // 2
+        self.angle = FACING_TO_ANGLE[self.facing]
 
 
 @dataclass
@@ -35,11 +48,27 @@ class Level:
     terrain: List[List[TerrainType]]
     obstacles: List[ObstaclePlacement]
     spawns: dict  # {"player1": SpawnPoint, "player2": SpawnPoint}
+    # Raw parsed level JSON, kept so consumers that need the on-disk
+    # shape (the API serves it to browser clients) don't re-open and
+    # re-parse the file
+    raw_json: dict = field(default_factory=dict, repr=False)
     collision_map: List[List[bool]] = field(default_factory=list)
+    # ndarray mirror of collision_map for vectorized bullet collision
+    collision_np: np.ndarray = field(init=False, repr=False)
+    # bit-packed rows (bit c of word r = cell blocked) — a whole row
+    # fits in one int, so LOS scans test cells with shift-and-mask.
+    # Plain Python ints, not a uint64 array: LOS lines span at most a
+    # dozen cells, where scalar shifts beat numpy's per-call overhead
+    collision_bits: Tuple[int, ...] = field(init=False, repr=False)
 
     def __post_init__(self):
         if not self.collision_map:
             self.collision_map = self.build_collision_map()
+        self.collision_np = np.asarray(self.collision_map, dtype=np.bool_)
+        self.collision_bits = tuple(
+            sum(1 << c for c, blocked in enumerate(row) if blocked)
+            for row in self.collision_map
+        )
 
     def build_collision_map(self) -> List[List[bool]]:
         grid = [[False] * self.columns for _ in range(self.rows)]
@@ -59,6 +88,19 @@ class Level:
             return False
         return not self.collision_map[row][col]
 
+    def is_passable_np(self, cols: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Vectorized is_passable over arrays of cell indices.
+
+        Out-of-bounds cells count as blocked, matching the scalar
+        version. One gather from collision_np replaces a Python call
+        per probed cell in the avoidance hot path.
+        """
+        in_bounds = ((cols >= 0) & (cols < self.columns)
+                     & (rows >= 0) & (rows < self.rows))
+        c = np.clip(cols, 0, self.columns - 1)
+        r = np.clip(rows, 0, self.rows - 1)
+        return in_bounds & ~self.collision_np[r, c]
+
     def get_blocked_cells(self) -> List[Tuple[int, int]]:
         blocked = []
         for r in range(self.rows):
@@ -107,6 +149,7 @@ def load_level(filepath: Path) -> Level:
         terrain=terrain,
         obstacles=obstacles,
         spawns=spawns,
+        raw_json=data,
     )
 
 
@@ -35,6 +35,8 @@ Does NOT apply to:
 import math
 from typing import List, Optional
 
+import numpy as np
+
 from tanks.constants import CELL_SIZE, TANK_HITBOX_HALF, TankCommand
 
 # ---------------------------------------------------------------------------
@@ -47,6 +49,25 @@ PROBE_STEPS = 5           # Sample points per feeler ray
 SIDE_ANGLES = [30, 60, 90]  # Offsets (degrees) for clearance probes
 HYSTERESIS = 2            # Side must be this many probes clearer to override
 
+# Hitbox corner offsets, shaped for broadcasting against projected centers
+_CORNER_DX = np.array([-TANK_HITBOX_HALF, TANK_HITBOX_HALF,
+                       -TANK_HITBOX_HALF, TANK_HITBOX_HALF])
+_CORNER_DY = np.array([-TANK_HITBOX_HALF, -TANK_HITBOX_HALF,
+                       TANK_HITBOX_HALF, TANK_HITBOX_HALF])
+# Center first, then left probes, then right — _probe_bundle and
+# _survey_sides split on this order
+_BUNDLE_OFFSETS = np.array([0] + [-a for a in SIDE_ANGLES] + SIDE_ANGLES)
+_SIDE_OFFSETS = _BUNDLE_OFFSETS[1:]
+# Sample distances along a feeler ray at the default radius/steps,
+# precomputed so the per-probe fast path allocates nothing
+_PROBE_STEP = SENSE_RADIUS / PROBE_STEPS
+_PROBE_DISTS = np.arange(1, PROBE_STEPS + 1) * _PROBE_STEP
+
+# Unit-direction lookup per 1° bucket — probing tolerates the
+# quantization, and a table read beats a transcendental per feeler
+_SIN_DEG = np.sin(np.radians(np.arange(360))).astype(np.float32)
+_NEG_COS_DEG = (-np.cos(np.radians(np.arange(360)))).astype(np.float32)
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -72,38 +93,77 @@ def _probe_direction(x: float, y: float, angle_deg: float, level,
 
     Returns ``(blocked, distance_to_first_block)``.  *distance* equals
     *radius* when the path is completely clear.
+
+    Tests the cell AABB the hitbox covers at each sample position with
+    one grid slice. The 72px hitbox inside 100px cells spans at most
+    2x2 cells, so this reads exactly the cells whose corners
+    Tank._can_move_to checks — same verdicts, fewer index computations
+    per sample. The per-tank hot path goes through _probe_bundle
+    instead, which batches the equivalent corner test across all
+    feelers.
     """
-    rad = math.radians(angle_deg)
-    dx = math.sin(rad)
-    dy = -math.cos(rad)
-    h = TANK_HITBOX_HALF
+    a = int(angle_deg % 360)
+    dx = _SIN_DEG[a]
+    dy = _NEG_COS_DEG[a]
     step_size = radius / steps
+    h = TANK_HITBOX_HALF
+    grid = level.collision_np
+    cmax = level.columns
+    rmax = level.rows
 
     for i in range(1, steps + 1):
         px = x + dx * step_size * i
         py = y + dy * step_size * i
-        # Check all four corners of the hitbox at the projected position
-        for cx, cy in [(px - h, py - h), (px + h, py - h),
-                       (px - h, py + h), (px + h, py + h)]:
-            col = int(cx // CELL_SIZE)
-            row = int(cy // CELL_SIZE)
-            if not level.is_passable(col, row):
-                return (True, step_size * i)
-
+        c0 = int((px - h) // CELL_SIZE)
+        c1 = int((px + h) // CELL_SIZE)
+        r0 = int((py - h) // CELL_SIZE)
+        r1 = int((py + h) // CELL_SIZE)
+        if c0 < 0 or r0 < 0 or c1 >= cmax or r1 >= rmax:
+            # Out of bounds counts as blocked, matching is_passable
+            return (True, step_size * i)
+        if grid[r0:r1 + 1, c0:c1 + 1].any():
+            return (True, step_size * i)
     return (False, radius)
 
 
+def _probe_bundle(x: float, y: float, angle: float, level):
+    """Probe the center heading and all six side feelers in one gather.
+
+    Builds the full 7 x steps x corners sample tensor — center ray
+    plus three feelers per side — and resolves it with a single
+    passability lookup, amortizing the trig and bounds math that
+    separate _probe_direction calls would repeat. With the hitbox
+    smaller than a cell, the four corner samples cover every cell the
+    hitbox AABB touches, so this is the same test Tank._can_move_to
+    and _probe_direction perform.
+
+    Returns ``(center_blocked, center_dist, left_clear, right_clear)``.
+    """
+    idx = ((angle + _BUNDLE_OFFSETS) % 360).astype(np.int32)
+    dx = _SIN_DEG[idx]
+    dy = _NEG_COS_DEG[idx]
+    dist = _PROBE_DISTS
+    cx = x + dx[:, None, None] * dist[None, :, None] + _CORNER_DX
+    cy = y + dy[:, None, None] * dist[None, :, None] + _CORNER_DY
+    passable = level.is_passable_np(
+        (cx // CELL_SIZE).astype(np.int32),
+        (cy // CELL_SIZE).astype(np.int32),
+    )
+
+    blocked_steps = ~passable[0].all(axis=1)
+    first = int(np.argmax(blocked_steps))
+    if blocked_steps[first]:
+        center_blocked, center_dist = True, _PROBE_STEP * (first + 1)
+    else:
+        center_blocked, center_dist = False, SENSE_RADIUS
+
+    clear = passable[1:].all(axis=(1, 2))
+    return center_blocked, center_dist, int(clear[:3].sum()), int(clear[3:].sum())
+
+
 def _survey_sides(x: float, y: float, angle: float, level):
     """Count how many side probes are clear on each side."""
-    left_clear = 0
-    right_clear = 0
-    for offset in SIDE_ANGLES:
-        l_blocked, _ = _probe_direction(x, y, (angle - offset) % 360, level)
-        r_blocked, _ = _probe_direction(x, y, (angle + offset) % 360, level)
-        if not l_blocked:
-            left_clear += 1
-        if not r_blocked:
-            right_clear += 1
+    _, _, left_clear, right_clear = _probe_bundle(x, y, angle, level)
     return left_clear, right_clear
 
 
@@ -183,7 +243,8 @@ class ObstacleAvoider:
             # Back up while rotating to get unstuck
             return [TankCommand.BACKWARD, self._committed]
 
-        center_blocked, center_dist = _probe_direction(x, y, angle, level)
+        center_blocked, center_dist, left_clear, right_clear = _probe_bundle(
+            x, y, angle, level)
 
         if not center_blocked:
             if self._committed is not None:
@@ -202,8 +263,6 @@ class ObstacleAvoider:
         # Path blocked — reset the clear-frame counter.
         self._clear_frames = 0
 
-        left_clear, right_clear = _survey_sides(x, y, angle, level)
-
         # --- direction selection with hysteresis ---
         if self._committed is not None:
             # Already committed — only switch if the other side is
@@ -239,11 +298,11 @@ def avoid_obstacles(x: float, y: float, angle: float, level,
     This function is still useful for single-frame checks where no
     persistent state is available.
     """
-    center_blocked, center_dist = _probe_direction(x, y, angle, level)
+    center_blocked, center_dist, left_clear, right_clear = _probe_bundle(
+        x, y, angle, level)
     if not center_blocked:
         return None
 
-    left_clear, right_clear = _survey_sides(x, y, angle, level)
     direction = _pick_direction(
         left_clear, right_clear, x, y, angle, target_x, target_y,
     )
@@ -1,15 +1,32 @@
-import math
 import pygame
 from typing import List
 
 from tanks.constants import (
-    CELL_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT,
+    CELL_SIZE, SIN_DEG, COS_DEG, WINDOW_WIDTH, WINDOW_HEIGHT,
     PLAYER_TANK_COLORS, FACING_ANGLES, TerrainType,
     TANK_HITBOX_HALF, TANK_MAX_HEALTH,
 )
 from tanks.assets import AssetManager
+from tanks.bullets import BULLETS
 from tanks.level import Level
 
+# Tank/bullet sprites are premultiplied at load time (see AssetManager);
+# they must be blitted with this flag, which is also the cheaper path
+_PREMUL = pygame.BLEND_PREMULTIPLIED
+
+
+def _display_alpha(surf: pygame.Surface) -> pygame.Surface:
+    """Match a cached surface to the display's pixel format.
+
+    Blitting a surface whose format differs from the display goes
+    through SDL's per-blit pixel converter; converting once at cache
+    time keeps the per-frame blit on the fast path. No-op when no
+    display mode is set (headless use).
+    """
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
 
 class LevelRenderer:
     def __init__(self, screen: pygame.Surface, assets: AssetManager) -> None:
@@ -17,15 +34,91 @@ class LevelRenderer:
         self.assets = assets
         self.show_grid = True
         self.show_collision = False
-        self._label_font = None
+        # SysFont construction and glyph rasterization are both costly
+        # enough to matter at 30 FPS on the menu/overlay screens, so
+        # fonts are cached by (size, bold) and rendered text surfaces
+        # by (font, text, color)
+        self._font_cache = {}
+        self._text_cache = {}
+        # Grid overlay is a pure function of the level dimensions and
+        # the collision overlay of the level's blocked cells; both are
+        # composed once and blitted thereafter
+        self._grid_overlay_cache = {}
+        self._collision_overlay = None
+        self._collision_key = None
+        # Static layer (terrain + transitions + obstacles) composed
+        # into one background surface when the level first renders —
+        # per frame it costs a single full-screen SDL blit instead of
+        # replaying a few hundred tile/sprite blits
+        self._bg_surface: pygame.Surface = None
+        self._bg_key = None
+        # Spawn markers resolved to a (surface, rect) blit list per level
+        self._spawn_blits = []
+        self._spawn_key = None
+        # Health bars are fixed-size solid rects; filling three small
+        # surfaces once and blitting (with an area rect for the health
+        # fraction) beats two pygame.draw.rect calls per tank per frame
+        self._hud_bg = self._hud_rect((60, 60, 60))
+        self._hud_fill_green = self._hud_rect((0, 200, 0))
+        self._hud_fill_red = self._hud_rect((200, 0, 0))
+
+    _HUD_BAR_W = 80
+    _HUD_BAR_H = 10
+
+    @staticmethod
+    def _hud_rect(color) -> pygame.Surface:
+        surf = pygame.Surface((LevelRenderer._HUD_BAR_W,
+                               LevelRenderer._HUD_BAR_H))
+        surf.fill(color)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        return surf
+
+    def _background(self, level: Level) -> pygame.Surface:
+        """Return the composed static layer for *level*, building it once."""
+        if self._bg_key != id(level):
+            bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            if pygame.display.get_surface() is not None:
+                bg = bg.convert()
+            seq = (
+                self._terrain_blits(level)
+                + self._transition_blits(level)
+                + self._obstacle_blits(level)
+            )
+            if hasattr(bg, "fblits"):
+                bg.fblits(seq)
+            else:
+                bg.blits(seq, doreturn=0)
+            self._bg_surface = bg
+            self._bg_key = id(level)
+        return self._bg_surface
+
+    def _font(self, size: int, bold: bool = False) -> pygame.font.Font:
+        """Return the shared consolas font at *size*, loading it once."""
+        key = (size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = pygame.font.SysFont("consolas", size, bold=bold)
+            self._font_cache[key] = font
+        return font
+
+    def _text(self, font: pygame.font.Font, msg: str,
+              color) -> pygame.Surface:
+        """Render *msg* with *font*, memoized on (font, text, color)."""
+        key = (id(font), msg, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) > 256:
+                self._text_cache.clear()
+            surf = _display_alpha(font.render(msg, True, color))
+            self._text_cache[key] = surf
+        return surf
 
     def render(self, level: Level, tanks: List = None) -> None:
-        self._draw_terrain(level)
-        self._draw_terrain_transitions(level)
-        self._draw_obstacles(level)
+        self.screen.blit(self._background(level), (0, 0))
         if tanks:
+            self._draw_bullets()
             for t in tanks:
-                self._draw_bullets(t)
                 self._draw_tank(t)
             self._draw_hud(tanks)
         else:
@@ -35,19 +128,21 @@ class LevelRenderer:
         if self.show_collision:
             self._draw_collision_overlay(level)
 
-    def _draw_terrain(self, level: Level) -> None:
-        for row in range(level.rows):
-            for col in range(level.columns):
-                terrain_type = level.terrain[row][col]
-                tile = self.assets.get_terrain(terrain_type)
-                self.screen.blit(tile, (col * CELL_SIZE, row * CELL_SIZE))
+    def _terrain_blits(self, level: Level) -> List:
+        return [
+            (self.assets.get_terrain(level.terrain[row][col]),
+             (col * CELL_SIZE, row * CELL_SIZE))
+            for row in range(level.rows)
+            for col in range(level.columns)
+        ]
 
-    def _draw_terrain_transitions(self, level: Level) -> None:
-        """Overlay dirt splotches biased toward the sand side of the border.
+    def _transition_blits(self, level: Level) -> List:
+        """Dirt splotches biased toward the sand side of the border.
 
         The overlay is shifted so ~1/3 sits on the dirt side and ~2/3 on sand.
         """
         third = CELL_SIZE // 3
+        blits = []
         for row in range(level.rows):
             for col in range(level.columns):
                 if level.terrain[row][col] != TerrainType.SAND:
@@ -55,15 +150,17 @@ class LevelRenderer:
                 px = col * CELL_SIZE
                 py = row * CELL_SIZE
                 if col > 0 and level.terrain[row][col - 1] == TerrainType.DIRT:
-                    self.screen.blit(self.assets.get_dirt_transition("left"), (px - third, py))
+                    blits.append((self.assets.get_dirt_transition("left"), (px - third, py)))
                 if col < level.columns - 1 and level.terrain[row][col + 1] == TerrainType.DIRT:
-                    self.screen.blit(self.assets.get_dirt_transition("right"), (px + third, py))
+                    blits.append((self.assets.get_dirt_transition("right"), (px + third, py)))
                 if row > 0 and level.terrain[row - 1][col] == TerrainType.DIRT:
-                    self.screen.blit(self.assets.get_dirt_transition("top"), (px, py - third))
+                    blits.append((self.assets.get_dirt_transition("top"), (px, py - third)))
                 if row < level.rows - 1 and level.terrain[row + 1][col] == TerrainType.DIRT:
-                    self.screen.blit(self.assets.get_dirt_transition("bottom"), (px, py + third))
+                    blits.append((self.assets.get_dirt_transition("bottom"), (px, py + third)))
+        return blits
 
-    def _draw_obstacles(self, level: Level) -> None:
+    def _obstacle_blits(self, level: Level) -> List:
+        blits = []
         for obs in level.obstacles:
             surface = self.assets.get_obstacle(obs.type, obs.span_w, obs.span_h)
             pixel_x = obs.col * CELL_SIZE
@@ -73,29 +170,36 @@ class LevelRenderer:
             span_pixel_h = obs.span_h * CELL_SIZE
             offset_x = (span_pixel_w - surface.get_width()) // 2
             offset_y = (span_pixel_h - surface.get_height()) // 2
-            self.screen.blit(surface, (pixel_x + offset_x, pixel_y + offset_y))
+            blits.append((surface, (pixel_x + offset_x, pixel_y + offset_y)))
+        return blits
 
     def _draw_spawns(self, level: Level) -> None:
-        for key, spawn in level.spawns.items():
-            player_num = int(key[-1])
-            color = PLAYER_TANK_COLORS[player_num]
-
-            body = self.assets.get_tank_body(color)
-            barrel = self.assets.get_tank_barrel(color)
-
-            angle = FACING_ANGLES[spawn.facing]
-            body_rot = pygame.transform.rotate(body, angle)
-            barrel_rot = pygame.transform.rotate(barrel, angle)
-
-            cx = spawn.col * CELL_SIZE + CELL_SIZE // 2
-            cy = spawn.row * CELL_SIZE + CELL_SIZE // 2
-
-            body_rect = body_rot.get_rect(center=(cx, cy))
-            self.screen.blit(body_rot, body_rect)
-
-            # Offset barrel in the facing direction
-            barrel_rect = barrel_rot.get_rect(center=(cx, cy))
-            self.screen.blit(barrel_rot, barrel_rect)
+        # Spawns are static per level; resolve sprites, rotations and
+        # rects once and replay the (surface, rect) list every frame
+        if self._spawn_key != id(level):
+            seq = []
+            for key, spawn in level.spawns.items():
+                player_num = int(key[-1])
+                color = PLAYER_TANK_COLORS[player_num]
+
+                angle = FACING_ANGLES[spawn.facing]
+                body_rot = self.assets.get_rotated(
+                    self.assets.get_tank_body(color), angle)
+                barrel_rot = self.assets.get_rotated(
+                    self.assets.get_tank_barrel(color), angle)
+
+                cx = spawn.col * CELL_SIZE + CELL_SIZE // 2
+                cy = spawn.row * CELL_SIZE + CELL_SIZE // 2
+                seq.append((body_rot, body_rot.get_rect(center=(cx, cy))))
+                seq.append((barrel_rot,
+                            barrel_rot.get_rect(center=(cx, cy))))
+            self._spawn_blits = seq
+            self._spawn_key = id(level)
+        if hasattr(self.screen, "fblits"):
+            self.screen.fblits(self._spawn_blits, _PREMUL)
+        else:
+            for surf, rect in self._spawn_blits:
+                self.screen.blit(surf, rect, special_flags=_PREMUL)
 
     def _draw_tank(self, tank) -> None:
         if not tank.alive:
@@ -105,30 +209,48 @@ class LevelRenderer:
 
         # pygame.transform.rotate uses CCW degrees; our angle is CW from north
         pg_angle = -tank.angle
-        body_rot = pygame.transform.rotate(body, pg_angle)
-        barrel_rot = pygame.transform.rotate(barrel, pg_angle)
+        body_rot = self.assets.get_rotated(body, pg_angle)
+        barrel_rot = self.assets.get_rotated(barrel, pg_angle)
 
         cx, cy = tank.x, tank.y
         body_rect = body_rot.get_rect(center=(cx, cy))
-        self.screen.blit(body_rot, body_rect)
+        self.screen.blit(body_rot, body_rect, special_flags=_PREMUL)
 
         # Offset barrel forward from center
-        rad = math.radians(tank.angle)
+        ai = int(tank.angle) % 360
         offset = CELL_SIZE * 0.12
-        bx = cx + math.sin(rad) * offset
-        by = cy - math.cos(rad) * offset
+        bx = cx + SIN_DEG[ai] * offset
+        by = cy - COS_DEG[ai] * offset
         barrel_rect = barrel_rot.get_rect(center=(bx, by))
-        self.screen.blit(barrel_rot, barrel_rect)
-
-    def _draw_bullets(self, tank) -> None:
-        for b in tank.bullets:
-            sprite = self.assets.get_bullet(b.color)
-            pg_angle = -b.angle
-            rotated = pygame.transform.rotate(sprite, pg_angle)
-            rect = rotated.get_rect(center=(b.x, b.y))
-            self.screen.blit(rotated, rect)
+        self.screen.blit(barrel_rot, barrel_rect, special_flags=_PREMUL)
+
+    def _draw_bullets(self) -> None:
+        # Gather every bullet into one sequence and hand it to SDL in a
+        # single batched call; bullets sharing an owner and angle reuse
+        # the same cached rotated sprite
+        get_bullet = self.assets.get_bullet
+        get_rotated = self.assets.get_rotated
+        seq = []
+        for x, y, angle, color in BULLETS.iter_active():
+            rotated = get_rotated(get_bullet(color), -angle)
+            seq.append((rotated, rotated.get_rect(center=(x, y))))
+        if not seq:
+            return
+        if hasattr(self.screen, "fblits"):
+            self.screen.fblits(seq, _PREMUL)
+        else:
+            for surf, rect in seq:
+                self.screen.blit(surf, rect, special_flags=_PREMUL)
 
     def _draw_grid_overlay(self, level: Level) -> None:
+        key = (level.rows, level.columns)
+        cached = self._grid_overlay_cache.get(key)
+        if cached is not None:
+            self.screen.blit(cached, (0, 0))
+            return
+
+        # First frame at these dimensions: compose dashes and labels
+        # onto one SRCALPHA surface, then reuse it every frame after
         grid_surface = pygame.Surface(
             (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA
         )
@@ -154,57 +276,68 @@ class LevelRenderer:
                 pygame.draw.line(grid_surface, color, (x, y), (end_x, y))
                 x += dash_len + gap_len
 
-        self.screen.blit(grid_surface, (0, 0))
-
         # Chess-style labels: letters (A-P) across columns, numbers (1-12) down rows
-        if self._label_font is None:
-            self._label_font = pygame.font.SysFont("consolas", 24, bold=True)
+        label_font = self._font(24, bold=True)
 
         label_bg = (0, 0, 0, 160)
         for col in range(level.columns):
             letter = chr(ord('A') + col)
-            text = self._label_font.render(letter, True, (255, 255, 255))
+            text = self._text(label_font, letter, (255, 255, 255))
             # Background pill behind label
             bg = pygame.Surface(
                 (text.get_width() + 8, text.get_height() + 4), pygame.SRCALPHA
             )
             bg.fill(label_bg)
             tx = col * CELL_SIZE + (CELL_SIZE - bg.get_width()) // 2
-            self.screen.blit(bg, (tx, 2))
-            self.screen.blit(text, (tx + 4, 4))
+            grid_surface.blit(bg, (tx, 2))
+            grid_surface.blit(text, (tx + 4, 4))
 
         for row in range(level.rows):
             number = str(row + 1)
-            text = self._label_font.render(number, True, (255, 255, 255))
+            text = self._text(label_font, number, (255, 255, 255))
             bg = pygame.Surface(
                 (text.get_width() + 8, text.get_height() + 4), pygame.SRCALPHA
             )
             bg.fill(label_bg)
             ty = row * CELL_SIZE + (CELL_SIZE - bg.get_height()) // 2
-            self.screen.blit(bg, (2, ty))
-            self.screen.blit(text, (6, ty + 2))
+            grid_surface.blit(bg, (2, ty))
+            grid_surface.blit(text, (6, ty + 2))
+
+        grid_surface = _display_alpha(grid_surface)
+        self._grid_overlay_cache[key] = grid_surface
+        self.screen.blit(grid_surface, (0, 0))
 
     def _draw_collision_overlay(self, level: Level) -> None:
-        overlay = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        overlay.fill((255, 0, 0, 60))
-        for col, row in level.get_blocked_cells():
-            self.screen.blit(overlay, (col * CELL_SIZE, row * CELL_SIZE))
+        if self._collision_key != id(level):
+            overlay = pygame.Surface(
+                (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA
+            )
+            cell = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+            cell.fill((255, 0, 0, 60))
+            for col, row in level.get_blocked_cells():
+                overlay.blit(cell, (col * CELL_SIZE, row * CELL_SIZE))
+            self._collision_overlay = _display_alpha(overlay)
+            self._collision_key = id(level)
+        self.screen.blit(self._collision_overlay, (0, 0))
 
     # ---- HUD ----
 
     def _draw_hud(self, tanks) -> None:
         """Draw health bars above each alive tank."""
+        bar_w = self._HUD_BAR_W
+        bar_h = self._HUD_BAR_H
         for tank in tanks:
             if not tank.alive:
                 continue
-            bar_w = 80
-            bar_h = 10
             bar_x = tank.x - bar_w // 2
             bar_y = tank.y - TANK_HITBOX_HALF - 24
-            pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, bar_y, bar_w, bar_h))
+            self.screen.blit(self._hud_bg, (bar_x, bar_y))
             fill_w = int(bar_w * (tank.health / TANK_MAX_HEALTH))
-            fill_color = (0, 200, 0) if tank.health > 1 else (200, 0, 0)
-            pygame.draw.rect(self.screen, fill_color, (bar_x, bar_y, fill_w, bar_h))
+            fill = (self._hud_fill_green if tank.health > 1
+                    else self._hud_fill_red)
+            if fill_w > 0:
+                self.screen.blit(fill, (bar_x, bar_y),
+                                 area=pygame.Rect(0, 0, fill_w, bar_h))
 
     # ---- Title Screen ----
 
@@ -213,21 +346,23 @@ class LevelRenderer:
         self.screen.fill((40, 35, 30))
 
         # Title
-        title_font = pygame.font.SysFont("consolas", 104, bold=True)
-        title_surf = title_font.render("TANK ARENA", True, (220, 200, 160))
+        title_surf = self._text(self._font(104, bold=True),
+                                "TANK ARENA", (220, 200, 160))
         title_rect = title_surf.get_rect(center=(WINDOW_WIDTH // 2, 300))
         self.screen.blit(title_surf, title_rect)
 
         # Decorative tanks
         blue_body = self.assets.get_tank_body("Blue")
         red_body = self.assets.get_tank_body("Red")
-        blue_rot = pygame.transform.rotate(blue_body, -90)
-        self.screen.blit(blue_rot, blue_rot.get_rect(center=(400, 300)))
-        red_rot = pygame.transform.rotate(red_body, 90)
-        self.screen.blit(red_rot, red_rot.get_rect(center=(1400, 300)))
+        blue_rot = self.assets.get_rotated(blue_body, -90)
+        self.screen.blit(blue_rot, blue_rot.get_rect(center=(400, 300)),
+                         special_flags=_PREMUL)
+        red_rot = self.assets.get_rotated(red_body, 90)
+        self.screen.blit(red_rot, red_rot.get_rect(center=(1400, 300)),
+                         special_flags=_PREMUL)
 
         # Menu options
-        option_font = pygame.font.SysFont("consolas", 64)
+        option_font = self._font(64)
         options = [
             # "1 Player",   # Commented out
             # "2 Players",  # Commented out
@@ -238,15 +373,15 @@ class LevelRenderer:
         for i, label in enumerate(options):
             color = (255, 255, 100) if i == selected_index else (180, 170, 140)
             prefix = "> " if i == selected_index else "  "
-            surf = option_font.render(prefix + label, True, color)
+            surf = self._text(option_font, prefix + label, color)
             rect = surf.get_rect(center=(WINDOW_WIDTH // 2, 600 + i * 100))
             self.screen.blit(surf, rect)
 
         # Instructions
-        hint_font = pygame.font.SysFont("consolas", 32)
-        hint = hint_font.render(
+        hint = self._text(
+            self._font(32),
             "UP/DOWN to select, ENTER to start, ESC to quit",
-            True, (120, 110, 100),
+            (120, 110, 100),
         )
         self.screen.blit(hint, hint.get_rect(center=(WINDOW_WIDTH // 2, 1000)))
 
@@ -258,16 +393,16 @@ class LevelRenderer:
         overlay.fill((0, 0, 0, 150))
         self.screen.blit(overlay, (0, 0))
 
-        font = pygame.font.SysFont("consolas", 96, bold=True)
-        text = font.render(f"{winner_color} Tank Wins!", True, (255, 255, 100))
+        text = self._text(self._font(96, bold=True),
+                          f"{winner_color} Tank Wins!", (255, 255, 100))
         self.screen.blit(
             text, text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 60))
         )
 
-        sub_font = pygame.font.SysFont("consolas", 44)
-        hint = sub_font.render(
+        hint = self._text(
+            self._font(44),
             "Press ESC to return to title",
-            True, (200, 190, 170),
+            (200, 190, 170),
         )
         self.screen.blit(
             hint, hint.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
@@ -286,29 +421,29 @@ class LevelRenderer:
         self.screen.fill((30, 30, 35))
 
         # Title
-        title_font = pygame.font.SysFont("consolas", 60, bold=True)
-        title_surf = title_font.render("GAME LOGS - DETAILED VIEW", True, (255, 255, 100))
+        title_surf = self._text(self._font(60, bold=True),
+                                "GAME LOGS - DETAILED VIEW", (255, 255, 100))
         self.screen.blit(title_surf, title_surf.get_rect(center=(WINDOW_WIDTH // 2, 60)))
 
         if game_history is None:
             # No logs available
-            msg_font = pygame.font.SysFont("consolas", 48)
-            msg = msg_font.render("No game history available", True, (180, 180, 180))
+            msg = self._text(self._font(48),
+                             "No game history available", (180, 180, 180))
             self.screen.blit(msg, msg.get_rect(center=(WINDOW_WIDTH // 2, 400)))
         else:
             # Get history data
             history = game_history.get_history(limit=50)
 
             # Column headers
-            header_font = pygame.font.SysFont("consolas", 32, bold=True)
+            header_font = self._font(32, bold=True)
             y_pos = 140
 
             # Blue tank header (left column)
-            blue_header = header_font.render("BLUE TANK (You)", True, (100, 150, 255))
+            blue_header = self._text(header_font, "BLUE TANK (You)", (100, 150, 255))
             self.screen.blit(blue_header, (80, y_pos))
 
             # Red tank header (right column)
-            red_header = header_font.render("RED TANK (Opponent)", True, (255, 100, 100))
+            red_header = self._text(header_font, "RED TANK (Opponent)", (255, 100, 100))
             self.screen.blit(red_header, (950, y_pos))
 
             y_pos += 50
@@ -320,8 +455,8 @@ class LevelRenderer:
             # Get only the most recent 4 snapshots to prevent overflow
             snapshots = filtered_snapshots[-4:]
 
-            data_font = pygame.font.SysFont("consolas", 20)
-            label_font = pygame.font.SysFont("consolas", 18, bold=True)
+            data_font = self._font(20)
+            label_font = self._font(18, bold=True)
 
             for snapshot in snapshots:
                 tanks = snapshot.get('tanks', {})
@@ -342,8 +477,8 @@ class LevelRenderer:
 
                 # Draw tick separator under each column
                 tick_text = f"─── Tick {tick} ───"
-                tick_label_blue = label_font.render(tick_text, True, (120, 160, 200))
-                tick_label_red = label_font.render(tick_text, True, (200, 120, 120))
+                tick_label_blue = self._text(label_font, tick_text, (120, 160, 200))
+                tick_label_red = self._text(label_font, tick_text, (200, 120, 120))
 
                 # Blue column tick
                 self.screen.blit(tick_label_blue, (80, y_pos))
@@ -362,7 +497,7 @@ class LevelRenderer:
                         f"Last Cmd: {last_p1_cmd}",
                     ]
                     for line in p1_lines:
-                        surf = data_font.render(line, True, (180, 200, 255))
+                        surf = self._text(data_font, line, (180, 200, 255))
                         self.screen.blit(surf, (x_pos, y_pos))
                         y_pos += 25
                     y_pos -= 100  # Reset for right column
@@ -378,15 +513,15 @@ class LevelRenderer:
                         f"Last Cmd: {last_p2_cmd}",
                     ]
                     for line in p2_lines:
-                        surf = data_font.render(line, True, (255, 180, 180))
+                        surf = self._text(data_font, line, (255, 180, 180))
                         self.screen.blit(surf, (x_pos, y_pos))
                         y_pos += 25
 
                 y_pos += 35  # Space between entries
 
         # Instructions
-        hint_font = pygame.font.SysFont("consolas", 28)
-        hint = hint_font.render("Press ESC to return to title", True, (120, 110, 100))
+        hint = self._text(self._font(28),
+                          "Press ESC to return to title", (120, 110, 100))
         self.screen.blit(hint, hint.get_rect(center=(WINDOW_WIDTH // 2, 1130)))
 
     # ---- Demo Overlay ----
@@ -402,32 +537,32 @@ class LevelRenderer:
         banner.fill((0, 0, 0, 180))
         self.screen.blit(banner, (0, 0))
 
-        title_font = pygame.font.SysFont("consolas", 36, bold=True)
-        cmd_font = pygame.font.SysFont("consolas", 28)
-        hint_font = pygame.font.SysFont("consolas", 24)
+        title_font = self._font(36, bold=True)
+        cmd_font = self._font(28)
+        hint_font = self._font(24)
 
         # Line 1: "DEMO MODE - <description>  (Example n/total)"
         desc = scenario.get("description", "")
         header = f"DEMO MODE - {desc}  (Example {scenario_index + 1}/{total})"
-        header_surf = title_font.render(header, True, (255, 255, 255))
+        header_surf = self._text(title_font, header, (255, 255, 255))
         self.screen.blit(
             header_surf,
             header_surf.get_rect(center=(WINDOW_WIDTH // 2, 32)),
         )
 
         # Line 2: Blue command
-        blue_text = f"Blue: {scenario.get('blue', '')}"
-        blue_surf = cmd_font.render(blue_text, True, (120, 160, 255))
+        blue_surf = self._text(cmd_font, f"Blue: {scenario.get('blue', '')}",
+                               (120, 160, 255))
         self.screen.blit(blue_surf, (32, 76))
 
         # Line 3: Red command (on its own line below blue)
-        red_text = f"Red: {scenario.get('red', '')}"
-        red_surf = cmd_font.render(red_text, True, (255, 130, 120))
+        red_surf = self._text(cmd_font, f"Red: {scenario.get('red', '')}",
+                              (255, 130, 120))
         self.screen.blit(red_surf, (32, 112))
 
         # Hint at bottom of banner
-        hint_surf = hint_font.render(
-            "Press ESC to return to title", True, (140, 130, 120),
+        hint_surf = self._text(
+            hint_font, "Press ESC to return to title", (140, 130, 120),
         )
         self.screen.blit(
             hint_surf,
@@ -0,0 +1,72 @@
+"""Lightweight command queue for the main game loop.
+
+Drop-in replacement for ``queue.Queue`` on the game's hot path. The
+main loop drains each command queue every frame; with ``queue.Queue``
+that costs one lock acquire/release plus one raised-and-caught
+``Empty`` exception per iteration. ``RingQueue`` keeps the same
+``put()`` / ``get_nowait()`` surface (so producers like the API
+server, AI, and demo controllers need no changes) but adds ``drain()``,
+which atomically swaps the internal buffer under a single lock and
+returns all pending items — one lock acquisition per frame and zero
+exceptions when the queue is empty.
+"""
+import threading
+from collections import deque
+from queue import Empty
+from typing import List
+
+
+class RingQueue:
+    """Bounded multi-producer queue optimized for batch draining.
+
+    Args:
+        maxlen: Maximum number of pending items. Older items are
+            dropped when full (stale commands are worthless anyway).
+    """
+
+    def __init__(self, maxlen: int = 256) -> None:
+        self._items = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def put(self, item) -> None:
+        """Append an item (thread-safe, never blocks)."""
+        with self._lock:
+            self._items.append(item)
+
+    def put_many(self, items) -> None:
+        """Append a batch of items under one lock acquisition.
+
+        Producers that emit several commands per tick (the demo and NL
+        executors) should prefer this over repeated ``put()`` calls.
+        """
+        with self._lock:
+            self._items.extend(items)
+
+    def get_nowait(self):
+        """Pop the oldest item, raising ``queue.Empty`` when none pending.
+
+        Kept for compatibility with ``queue.Queue`` consumers; the main
+        loop should prefer ``drain()``.
+        """
+        with self._lock:
+            if not self._items:
+                raise Empty
+            return self._items.popleft()
+
+    def drain(self) -> List:
+        """Atomically remove and return all pending items.
+
+        Swaps the internal deque for a fresh one under the lock, so the
+        caller iterates the returned batch without holding the lock.
+        Returns an empty list when nothing is pending.
+        """
+        if not self._items:  # cheap racy pre-check; producers re-appear next frame
+            return []
+        with self._lock:
+            items = self._items
+            self._items = deque(maxlen=items.maxlen)
+        return list(items)
+
+    def empty(self) -> bool:
+        """Return True if no items are pending (advisory only)."""
+        return not self._items
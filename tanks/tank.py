@@ -1,42 +1,34 @@
 import math
+import numpy as np
 import pygame
 from typing import List
 
 from tanks.constants import (
-    CELL_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT,
+    CELL_SIZE, SIN_DEG, COS_DEG,
     TANK_SPEED, TANK_ROTATION_SPEED, TANK_HITBOX_HALF,
-    BULLET_SPEED, BULLET_COOLDOWN_MS,
+    BULLET_COOLDOWN_MS,
     SHOOT_SLOWDOWN_MS, SHOOT_SPEED_FACTOR,
     TANK_MAX_HEALTH, BULLET_DAMAGE, TankCommand,
 )
+from tanks.bullets import BULLETS
 from tanks.level import Level
 
+# Millisecond clock sampled once per frame by the game loop. Cooldown
+# and slowdown checks read this instead of each making their own
+# SDL_GetTicks call, which also makes a tick's command processing
+# deterministic within the frame.
+CURRENT_TICK: int = 0
 
-class Bullet:
-    def __init__(self, x: float, y: float, angle: float, color: str) -> None:
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.color = color
-        self.alive = True
-        rad = math.radians(angle)
-        self.dx = math.sin(rad) * BULLET_SPEED
-        self.dy = -math.cos(rad) * BULLET_SPEED
-
-    def update(self, level: Level) -> None:
-        self.x += self.dx
-        self.y += self.dy
+# Key codes bound at module level — handle_input runs every frame a key
+# is held, and LOAD_GLOBAL on these beats attribute lookups on pygame
+_K_W, _K_S, _K_A, _K_D = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+_K_SPACE = pygame.K_SPACE
 
-        # Off-screen check
-        if not (0 <= self.x <= WINDOW_WIDTH and 0 <= self.y <= WINDOW_HEIGHT):
-            self.alive = False
-            return
 
-        # Grid collision
-        col = int(self.x // CELL_SIZE)
-        row = int(self.y // CELL_SIZE)
-        if not level.is_passable(col, row):
-            self.alive = False
+def set_tick(ms: int) -> None:
+    """Publish the frame's pygame.time.get_ticks() value to all tanks."""
+    global CURRENT_TICK
+    CURRENT_TICK = ms
 
 
 class Tank:
@@ -45,122 +37,120 @@ class Tank:
         self.y = y
         self.angle = angle  # 0=up, 90=right, 180=down, 270=left
         self.color = color
-        self.bullets: List[Bullet] = []
+        self.owner = BULLETS.owner_id(color)
         self._last_shot_time = 0
         self.health: int = TANK_MAX_HEALTH
         self.alive: bool = True
         self.speed_multiplier: float = speed_multiplier
+        # Set whenever observable state may have changed; GameState
+        # skips rebuilding a clean tank's published entry
+        self._dirty: bool = True
 
     def _current_speed(self) -> float:
         """Return movement speed, reduced briefly after firing."""
-        now = pygame.time.get_ticks()
+        now = CURRENT_TICK
         base_speed = TANK_SPEED * self.speed_multiplier
         if now - self._last_shot_time < SHOOT_SLOWDOWN_MS:
             return base_speed * SHOOT_SPEED_FACTOR
         return base_speed
 
-    def handle_input(self, keys, level: Level) -> None:
+    def handle_input(self, held_keys, level: Level) -> None:
+        """Apply manual controls from *held_keys*, the set of currently
+        pressed key codes maintained by the game loop."""
         if not self.alive:
             return
+        self._dirty = True
 
         # Rotation: A/D
-        if keys[pygame.K_a]:
+        if _K_A in held_keys:
             self.angle = (self.angle - TANK_ROTATION_SPEED) % 360
-        if keys[pygame.K_d]:
+        if _K_D in held_keys:
             self.angle = (self.angle + TANK_ROTATION_SPEED) % 360
 
         # Movement: W/S
         speed = self._current_speed()
-        rad = math.radians(self.angle)
-        dx = math.sin(rad) * speed
-        dy = -math.cos(rad) * speed
+        ai = int(self.angle) % 360
+        dx = SIN_DEG[ai] * speed
+        dy = -COS_DEG[ai] * speed
 
-        if keys[pygame.K_w]:
+        if _K_W in held_keys:
             nx, ny = self.x + dx, self.y + dy
             if self._can_move_to(nx, ny, level):
                 self.x, self.y = nx, ny
-        if keys[pygame.K_s]:
+        if _K_S in held_keys:
             nx, ny = self.x - dx, self.y - dy
             if self._can_move_to(nx, ny, level):
                 self.x, self.y = nx, ny
 
         # Shoot: Space
-        if keys[pygame.K_SPACE]:
+        if _K_SPACE in held_keys:
             self._try_shoot()
 
     def _try_shoot(self) -> None:
-        now = pygame.time.get_ticks()
+        now = CURRENT_TICK
         cooldown_elapsed = now - self._last_shot_time
         if cooldown_elapsed >= BULLET_COOLDOWN_MS:
             self._last_shot_time = now
-            rad = math.radians(self.angle)
+            ai = int(self.angle) % 360
             spawn_dist = CELL_SIZE * 0.45
-            bx = self.x + math.sin(rad) * spawn_dist
-            by = self.y - math.cos(rad) * spawn_dist
-            self.bullets.append(Bullet(bx, by, self.angle, self.color))
-            # print(f"Tank {self.color} fired bullet! Total bullets: {len(self.bullets)}")
-        else:
-            pass  # print(f"Tank {self.color} shoot blocked by cooldown")
+            bx = self.x + SIN_DEG[ai] * spawn_dist
+            by = self.y - COS_DEG[ai] * spawn_dist
+            BULLETS.spawn(bx, by, self.angle, self.owner)
 
     def apply_command(self, command: TankCommand, level: Level) -> None:
         if not self.alive:
-            # print(f"Tank {self.color} apply_command: not alive, ignoring {command}")
             return
+        self._dirty = True
 
         # First, check if we're stuck and need to force unstuck
         if not self._can_move_to(self.x, self.y, level):
-            # print(f"Tank {self.color} is stuck at ({self.x:.1f}, {self.y:.1f}), force unstucking")
             self._force_unstuck(level)
             return
 
-        # print(f"Tank {self.color} applying command: {command}")
-
         if command == TankCommand.ROTATE_LEFT:
             self.angle = (self.angle - TANK_ROTATION_SPEED) % 360
         elif command == TankCommand.ROTATE_RIGHT:
             self.angle = (self.angle + TANK_ROTATION_SPEED) % 360
         elif command == TankCommand.FORWARD:
             speed = self._current_speed()
-            rad = math.radians(self.angle)
-            nx = self.x + math.sin(rad) * speed
-            ny = self.y - math.cos(rad) * speed
+            ai = int(self.angle) % 360
+            nx = self.x + SIN_DEG[ai] * speed
+            ny = self.y - COS_DEG[ai] * speed
             if self._can_move_to(nx, ny, level):
                 self.x, self.y = nx, ny
         elif command == TankCommand.BACKWARD:
             speed = self._current_speed()
-            rad = math.radians(self.angle)
-            nx = self.x - math.sin(rad) * speed
-            ny = self.y + math.cos(rad) * speed
+            ai = int(self.angle) % 360
+            nx = self.x - SIN_DEG[ai] * speed
+            ny = self.y + COS_DEG[ai] * speed
             if self._can_move_to(nx, ny, level):
                 self.x, self.y = nx, ny
         elif command == TankCommand.SHOOT:
             self._try_shoot()
 
     def take_damage(self, amount: int = BULLET_DAMAGE) -> None:
+        self._dirty = True
         self.health -= amount
         if self.health <= 0:
             self.health = 0
             self.alive = False
 
-    def update_bullets(self, level: Level) -> None:
-        for b in self.bullets:
-            b.update(level)
-        self.bullets = [b for b in self.bullets if b.alive]
-
     def _can_move_to(self, nx: float, ny: float, level: Level) -> bool:
+        # The four hitbox corners land in at most the four cells
+        # (r0/r1, c0/c1); read the collision grid directly instead of
+        # building a corner list and calling is_passable per corner —
+        # this runs for every movement command every tick
         h = TANK_HITBOX_HALF
-        corners = [
-            (nx - h, ny - h),
-            (nx + h, ny - h),
-            (nx - h, ny + h),
-            (nx + h, ny + h),
-        ]
-        for cx, cy in corners:
-            col = int(cx // CELL_SIZE)
-            row = int(cy // CELL_SIZE)
-            if not level.is_passable(col, row):
-                return False
-        return True
+        c0 = int((nx - h) // CELL_SIZE)
+        c1 = int((nx + h) // CELL_SIZE)
+        r0 = int((ny - h) // CELL_SIZE)
+        r1 = int((ny + h) // CELL_SIZE)
+        if c0 < 0 or r0 < 0 or c1 >= level.columns or r1 >= level.rows:
+            return False
+        cmap = level.collision_map
+        row0 = cmap[r0]
+        row1 = cmap[r1]
+        return not (row0[c0] or row0[c1] or row1[c0] or row1[c1])
 
     def _force_unstuck(self, level: Level) -> None:
         """Push the tank out of walls when stuck."""
@@ -204,18 +194,33 @@ class Tank:
 
 
 def check_bullet_tank_collisions(tanks: List[Tank]) -> None:
-    """Check all bullets against all tanks, applying damage on hit."""
-    for shooter in tanks:
-        for bullet in shooter.bullets:
-            if not bullet.alive:
-                continue
-            for target in tanks:
-                if target.color == bullet.color:
-                    continue
-                if not target.alive:
-                    continue
-                dx = bullet.x - target.x
-                dy = bullet.y - target.y
-                if dx * dx + dy * dy <= TANK_HITBOX_HALF ** 2:
-                    bullet.alive = False
-                    target.take_damage()
+    """Check all bullets against all tanks, applying damage on hit.
+
+    Works directly on the shared bullet pool's arrays: one broadcasted
+    squared-distance comparison of every bullet against every live
+    tank, with an integer owner compare excluding a tank's own shots.
+    Only the (rare) actual hit pairs fall back to per-object Python
+    to apply damage.
+    """
+    n = BULLETS.count
+    targets = [t for t in tanks if t.alive]
+    if not n or not targets:
+        return
+
+    tpos = np.array([(t.x, t.y) for t in targets], dtype=np.float32)
+    d2 = ((BULLETS.x[:n, None] - tpos[None, :, 0]) ** 2
+          + (BULLETS.y[:n, None] - tpos[None, :, 1]) ** 2)
+
+    # Bullets never hit the tank that fired them
+    owner_match = BULLETS.owner[:n, None] == np.array(
+        [t.owner for t in targets], dtype=np.int8,
+    )[None, :]
+    hit = ((d2 <= TANK_HITBOX_HALF ** 2) & ~owner_match
+           & BULLETS.alive[:n, None])
+
+    for bi, ti in zip(*np.nonzero(hit)):
+        target = targets[ti]
+        if not target.alive or not BULLETS.alive[bi]:
+            continue
+        BULLETS.alive[bi] = False
+        target.take_damage()
@@ -20,17 +20,23 @@ from queue import Queue
 from typing import Optional, List, Callable
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-from tanks.constants import TankCommand, ASSET_ROOT, GameMode
+from tanks.constants import (
+    TankCommand, ASSET_ROOT, GameMode, StrategyCmd, ClearStrategyCmd,
+)
 from tanks.command_system import parse_command
 
 app = FastAPI(
     title="Tank Arena API",
     description="Control tanks via HTTP requests",
     version="1.0.0",
+    # /state is polled continuously and /log can carry 1000 entries;
+    # orjson encodes those nested dicts in C instead of through the
+    # stdlib json path
+    default_response_class=ORJSONResponse,
 )
 
 # Mount sprite assets for browser rendering
@@ -201,9 +207,18 @@ _ws_clients: list = []
 
 @app.websocket("/ws")
 async def websocket_game(websocket: WebSocket):
-    """Push game state at 30 FPS over WebSocket. Also accepts commands."""
+    """Push game state at 30 FPS over WebSocket. Also accepts commands.
+
+    State is only snapshotted and sent when the game has actually
+    advanced (tick or phase changed) or on a periodic heartbeat. This
+    keeps the API thread from copying game state under the shared lock
+    30 times a second per client while the game sits on the title
+    screen, which would contend with the render loop for the GIL.
+    """
     await websocket.accept()
     _ws_clients.append(websocket)
+    last_sent = None
+    last_sent_time = 0.0
     try:
         while True:
             # Check for incoming commands from client
@@ -219,11 +234,11 @@ async def websocket_game(websocket: WebSocket):
                 elif "strategy" in data and _p1_queue is not None:
                     text = data["strategy"].strip()
                     if not text or text.lower() == "stop":
-                        _p1_queue.put(("clear_strategy",))
+                        _p1_queue.put(ClearStrategyCmd())
                     else:
                         parsed = parse_command(text)
                         if parsed:
-                            _p1_queue.put(("strategy", text, parsed))
+                            _p1_queue.put(StrategyCmd(text, parsed))
                 elif "start" in data and _start_game_fn is not None:
                     mode = _MODE_MAP.get(data["start"])
                     if mode:
@@ -240,10 +255,15 @@ async def websocket_game(websocket: WebSocket):
             except asyncio.TimeoutError:
                 pass
 
-            # Push current state
+            # Push current state when it changed (plus a 0.5s heartbeat)
             if _game_state is not None:
-                state = _game_state.snapshot()
-                await websocket.send_json(state)
+                now = asyncio.get_event_loop().time()
+                marker = (_game_state.tick, _game_state.phase)
+                if marker != last_sent or now - last_sent_time >= 0.5:
+                    state = _game_state.snapshot()
+                    await websocket.send_json(state)
+                    last_sent = marker
+                    last_sent_time = now
 
     except WebSocketDisconnect:
         pass
@@ -334,7 +354,7 @@ def player2_strategy(request: StrategyRequest):
 def _handle_strategy(text: str, queue: Queue, player: int) -> StrategyResponse:
     text = text.strip()
     if not text or text.lower() == "stop":
-        queue.put(("clear_strategy",))
+        queue.put(ClearStrategyCmd())
         return StrategyResponse(status="ok", text=text or "stop", parsed=[], player=player)
 
     parsed = parse_command(text)
@@ -343,7 +363,7 @@ def _handle_strategy(text: str, queue: Queue, player: int) -> StrategyResponse:
             status_code=400,
             detail=f"Could not parse any commands from: '{text}'",
         )
-    queue.put(("strategy", text, parsed))
+    queue.put(StrategyCmd(text, parsed))
     return StrategyResponse(
         status="ok",
         text=text,
@@ -414,4 +434,10 @@ def run_tank_api(
     print('       -d \'{"text": "patrol between B2 and B9 and shoot at anything in your sight"}\'')
     print("=" * 70 + "\n")
 
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # access_log formats and writes a line per request; /state and /ws
+    # polling makes that constant CPU work competing with the 60 fps
+    # game thread. uvicorn's "auto" loop/http selection picks up uvloop
+    # and httptools when installed (see requirements.txt) and falls
+    # back to asyncio/h11 otherwise.
+    uvicorn.run(app, host=host, port=port, log_level="warning",
+                access_log=False)